@@ -0,0 +1,104 @@
+"""
+Article file I/O shared by the sentiment and emotion analyzers.
+Reads JSON and NDJSON article files, optionally streaming them, and writes
+analyzed articles with scores rounded only at write time.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+from src.analysis.rounding import round_floats
+
+
+def load_articles_from_json(filepath: str, stream: bool = False) -> Iterable[Dict]:
+    """
+    Load articles from JSON file.
+
+    Files ending in .ndjson are read lazily and returned as a generator with
+    one article per line; anything else is parsed whole and returned as a list.
+    With stream=True a JSON file is instead parsed incrementally (via ijson,
+    when installed) and returned as a generator of articles.
+    """
+    if Path(filepath).suffix == ".ndjson":
+        return _iter_ndjson_articles(filepath)
+    if stream and ijson is not None:
+        return _iter_json_articles(filepath)
+    if stream:
+        return iter(load_articles_from_json(filepath))
+
+    if orjson is not None:
+        with open(filepath, "rb") as handle:
+            data = orjson.loads(handle.read())
+    else:
+        with open(filepath, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+
+    if isinstance(data, dict) and "articles" in data:
+        return data["articles"]
+    if isinstance(data, list):
+        return data
+    return []
+
+
+def _iter_json_articles(filepath: str) -> Iterator[Dict]:
+    with open(filepath, "rb") as handle:
+        first = handle.read(1)
+        while first.isspace():
+            first = handle.read(1)
+        if first not in {b"{", b"["}:
+            return
+        handle.seek(handle.tell() - 1)
+        prefix = "articles.item" if first == b"{" else "item"
+        yield from ijson.items(handle, prefix, use_float=True)
+
+
+def _iter_ndjson_articles(filepath: str) -> Iterator[Dict]:
+    with open(filepath, "rb") as handle:
+        for line in handle:
+            if line.strip():
+                yield orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def write_articles_payload(payload: Dict[str, Any], output_path: str) -> None:
+    """Write an {"articles": [...], ...} payload as indented JSON, rounding its articles."""
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    payload = dict(payload, articles=round_floats(payload["articles"]))
+
+    if orjson is not None:
+        with open(output_file, "wb") as handle:
+            handle.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, ensure_ascii=False)
+
+
+def save_analyzed_articles_ndjson(articles: Iterable[Dict], output_path: str) -> int:
+    """Stream analyzed articles to a newline-delimited JSON file, one per line."""
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with open(output_file, "wb") as handle:
+        for article in articles:
+            article = round_floats(article)
+            if orjson is not None:
+                handle.write(orjson.dumps(article, option=orjson.OPT_NON_STR_KEYS))
+            else:
+                handle.write(json.dumps(article, ensure_ascii=False).encode("utf-8"))
+            handle.write(b"\n")
+            count += 1
+
+    print(f"Saved {count} analyzed articles to: {output_path}")
+    return count
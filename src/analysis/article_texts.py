@@ -0,0 +1,20 @@
+"""
+Shared text preparation for the article analyzers.
+Collects the non-empty, truncated field texts of an article list in one pass;
+the combined analysis paths hand the same triples to every analyzer.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+MAX_TEXT_CHARS = 512
+
+
+def prepare_texts(articles: List[Dict], fields: Sequence[str]) -> List[Tuple[int, str, str]]:
+    """Return (article_index, field, text[:512]) for every non-blank field."""
+    entries = []
+    for index, article in enumerate(articles):
+        for field in fields:
+            text = article.get(field, "")
+            if text and text.strip():
+                entries.append((index, field, text[:MAX_TEXT_CHARS]))
+    return entries
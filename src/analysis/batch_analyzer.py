@@ -0,0 +1,141 @@
+"""
+Batched article scoring shared by the sentiment and emotion analyzers.
+Texts are deduplicated, looked up in the persistent inference cache and
+streamed through the transformer pipeline in length-sorted batches, with
+the analyzer's lexical model as the fallback.
+"""
+
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+from tqdm import tqdm
+
+from src.analysis.article_texts import prepare_texts
+from src.analysis.model_runtime import inference_context
+
+
+class BatchAnalyzerMixin:
+    """
+    Batch and streaming article analysis for a single-model analyzer.
+
+    Subclasses set ANALYSIS_NAME and provide backend, model, runtime,
+    inference_cache, model_key and _analyze_cached, plus _apply_scores,
+    _scores_from_label_scores and _analyze_text_heuristic.
+    """
+
+    ANALYSIS_NAME = "text"
+
+    def cache_info(self):
+        """Return hit/miss counters for the analyze_text cache."""
+        return self._analyze_cached.cache_info()
+
+    def iter_analyze_articles(
+        self,
+        articles: Iterable[Dict],
+        fields: List[str] = None,
+        batch_size: int = 32,
+        chunk_size: int = 1024,
+    ) -> Iterator[Dict]:
+        """
+        Lazily analyze a stream of articles.
+
+        Articles are pulled chunk_size at a time and results are yielded one
+        by one, so a large NDJSON corpus never has to sit in memory at once.
+        Results are written into the input dictionaries.
+        """
+        if fields is None:
+            fields = ["title", "description"]
+
+        iterator = iter(articles)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            yield from self._analyze_article_chunk(chunk, fields, batch_size, inplace=True)
+
+    def _analyze_article_chunk(
+        self,
+        articles: List[Dict],
+        fields: List[str],
+        batch_size: int,
+        inplace: bool,
+    ) -> List[Dict]:
+        """Score one list of articles with a single deduplicated batch pass."""
+        entries = prepare_texts(articles, fields)
+
+        # Wire reprints repeat titles and descriptions verbatim; score each distinct text once.
+        unique_texts = list(dict.fromkeys(text for _, _, text in entries))
+        unique_scores = dict(zip(unique_texts, self._analyze_texts(unique_texts, batch_size=batch_size)))
+        return self._apply_scores(articles, entries, unique_scores, inplace)
+
+    def _run_model(self, inputs, **kwargs):
+        """Call the transformer pipeline without autograd bookkeeping."""
+        with inference_context(self.runtime):
+            return self.model(inputs, **kwargs)
+
+    def _stream_model(self, texts: Iterable[str], batch_size: int):
+        """
+        Stream pipeline outputs for many texts from one pipeline call.
+
+        The pipeline batches the input generator itself (batch_size texts
+        per forward pass) and yields one output per text; inference mode
+        stays active while the caller iterates.
+        """
+        with inference_context(self.runtime):
+            yield from self.model(iter(texts), batch_size=batch_size, truncation=True)
+
+    def _analyze_texts(self, texts: List[str], batch_size: int = 32) -> List[Dict]:
+        """
+        Score many pre-truncated texts, batching transformer calls.
+
+        Texts already in the persistent inference cache are not re-run.
+        The rest are sorted by length before batching ("smart batching") so
+        each batch pads to a similar sequence length; results are scattered
+        back in input order as the pipeline streams them.
+        """
+        if self.backend == "transformers" and self.model is not None and texts:
+            cached = self._cached_scores(texts)
+            if self.inference_cache is not None:
+                print(
+                    f"{self.ANALYSIS_NAME.capitalize()} inference cache: "
+                    f"{len(cached)}/{len(texts)} texts reused ({len(cached) / len(texts):.0%})"
+                )
+            order = sorted(
+                (position for position in range(len(texts)) if position not in cached),
+                key=lambda position: len(texts[position]),
+            )
+            results: List[Dict] = [cached.get(position, {}) for position in range(len(texts))]
+            try:
+                if order:
+                    outputs = self._stream_model((texts[position] for position in order), batch_size)
+                    progress = tqdm(outputs, total=len(order), desc=f"Analyzing {self.ANALYSIS_NAME}")
+                    for position, output in zip(order, progress):
+                        # Single-label pipelines yield one dict per text, top_k=None ones a list.
+                        label_scores = output if isinstance(output, list) else [output]
+                        results[position] = self._scores_from_label_scores(label_scores)
+            except Exception as exc:
+                print(f"Error analyzing {self.ANALYSIS_NAME} with transformers: {exc}")
+            else:
+                self._store_scores({texts[position]: results[position] for position in order})
+                return results
+
+        return [self._analyze_text_heuristic(text) for text in texts]
+
+    def _cached_scores(self, texts: List[str]) -> Dict[int, Dict]:
+        """Return persisted results for `texts` keyed by position; empty if the cache is off or unreadable."""
+        if self.inference_cache is None or not texts:
+            return {}
+        try:
+            return self.inference_cache.lookup(texts, self.model_key)
+        except Exception as exc:
+            print(f"Inference cache lookup failed, scoring every {self.ANALYSIS_NAME} text: {exc}")
+            return {}
+
+    def _store_scores(self, results: Dict[str, Dict]) -> None:
+        """Persist freshly computed {text: result} pairs; a cache failure never discards them."""
+        if self.inference_cache is None or not results:
+            return
+        try:
+            self.inference_cache.store(results, self.model_key)
+        except Exception as exc:
+            print(f"Could not write {self.ANALYSIS_NAME} results to the inference cache: {exc}")
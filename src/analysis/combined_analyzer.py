@@ -0,0 +1,229 @@
+"""
+Combined sentiment and emotion analysis over one transformer encoder pass.
+When both analyzers use classification heads on the same backbone weights,
+the encoder runs once per batch and both heads read its hidden states;
+otherwise the models stay separate and share text preparation/tokenization.
+"""
+
+from dataclasses import dataclass
+import heapq
+import math
+from operator import itemgetter
+from pathlib import Path
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import torch
+except Exception:  # pragma: no cover - optional dependency failure
+    torch = None
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analysis.article_texts import prepare_texts
+from src.analysis.emotion import EmotionAnalyzer
+from src.analysis.model_runtime import TORCH_RUNTIMES
+from src.analysis.multi_analysis import (
+    _analyze_shared_tokens,
+    _shared_tokenizer,
+    _tokenizers_compatible,
+    analyze_articles_multi,
+)
+from src.analysis.sentiment import SentimentAnalyzer
+
+SHARED_HEAD_MODEL_TYPES = {"bert", "distilbert", "roberta", "xlm-roberta"}
+
+
+class CombinedAnalyzer:
+    """Run sentiment and emotion analysis together, sharing encoder work where possible."""
+
+    def __init__(
+        self,
+        sentiment_analyzer: Optional[SentimentAnalyzer] = None,
+        emotion_analyzer: Optional[EmotionAnalyzer] = None,
+    ):
+        """
+        Initialize the combined analyzer.
+
+        Args:
+            sentiment_analyzer: Loaded sentiment analyzer (a default one is built if omitted)
+            emotion_analyzer: Loaded emotion analyzer (a default one is built if omitted)
+        """
+        self.sentiment_analyzer = sentiment_analyzer or SentimentAnalyzer()
+        self.emotion_analyzer = emotion_analyzer or EmotionAnalyzer()
+        self.analyzers = [self.sentiment_analyzer, self.emotion_analyzer]
+        self.shared_backbone = _shares_backbone(self.sentiment_analyzer, self.emotion_analyzer)
+
+        if self.shared_backbone:
+            print("Sentiment and emotion heads share one encoder pass")
+        else:
+            print("Sentiment and emotion models kept separate (encoders differ)")
+
+    def analyze_articles(
+        self,
+        articles: Iterable[Dict],
+        fields: List[str] = None,
+        batch_size: int = 32,
+        inplace: bool = False,
+    ) -> List[Dict]:
+        """
+        Add both "sentiment_analysis" and "emotion_analysis" to every article.
+
+        Args:
+            articles: Article dictionaries (any iterable)
+            fields: Which fields to analyze
+            batch_size: Number of texts per encoder forward pass
+            inplace: Write results into the input dictionaries
+
+        Returns:
+            Articles with both analyses added
+        """
+        if not self.shared_backbone:
+            return analyze_articles_multi(articles, self.analyzers, fields=fields, batch_size=batch_size, inplace=inplace)
+
+        if not isinstance(articles, list):
+            articles = list(articles)
+        if fields is None:
+            fields = ["title", "description"]
+
+        entries = prepare_texts(articles, fields)
+        unique_texts = list(dict.fromkeys(text for _, _, text in entries))
+        scores_by_analyzer = _analyze_shared_tokens(
+            unique_texts,
+            self.analyzers,
+            batch_size,
+            logits_fn=self._shared_backbone_logits,
+        )
+
+        analyzed_articles = articles if inplace else [article.copy() for article in articles]
+        for analyzer in self.analyzers:
+            scores = scores_by_analyzer.get(id(analyzer))
+            if scores is None:
+                scores = analyzer._analyze_texts(unique_texts, batch_size=batch_size)
+            analyzed_articles = analyzer._apply_scores(
+                analyzed_articles, entries, dict(zip(unique_texts, scores)), True
+            )
+        return analyzed_articles
+
+    def _shared_backbone_logits(self, batch) -> List:
+        """Run the encoder once and feed its outputs to each analyzer's classifier head."""
+        models = [analyzer.model.model for analyzer in self.analyzers]
+        base_outputs = models[0].base_model(**batch)
+        return [_classifier_logits(model, base_outputs) for model in models]
+
+
+@dataclass
+class CombinedBatch:
+    """
+    Column view of combined results, one array per reported field.
+
+    Columns are aligned with `articles`, which is referenced rather than
+    copied and remains the source for the full JSON output. Missing labels
+    are empty strings, missing scores NaN; `emotion_matrix` has one column
+    per EmotionAnalyzer.EMOTIONS entry.
+    """
+
+    articles: List[Dict]
+    titles: np.ndarray
+    sources: np.ndarray
+    published_at: np.ndarray
+    sentiment_labels: np.ndarray
+    sentiment_scores: np.ndarray
+    emotion_labels: np.ndarray
+    emotion_scores: np.ndarray
+    emotion_matrix: np.ndarray
+
+    @classmethod
+    def from_articles(cls, articles: List[Dict]) -> "CombinedBatch":
+        """Build the columns from articles carrying sentiment and emotion analyses."""
+        sentiments = [(article.get("sentiment_analysis") or {}).get("overall") or {} for article in articles]
+        emotions = [(article.get("emotion_analysis") or {}).get("overall") or {} for article in articles]
+        return cls(
+            articles=articles,
+            titles=_column(article.get("title", "No title") for article in articles),
+            sources=_column(article.get("source", "Unknown") for article in articles),
+            published_at=_column(article.get("published_at", "Unknown") for article in articles),
+            sentiment_labels=_column(overall.get("label", "") for overall in sentiments),
+            sentiment_scores=np.array([overall.get("score", np.nan) for overall in sentiments], dtype=np.float64),
+            emotion_labels=_column(overall.get("dominant_emotion", "") for overall in emotions),
+            emotion_scores=np.array([overall.get("dominant_score", np.nan) for overall in emotions], dtype=np.float64),
+            emotion_matrix=np.array(
+                [[overall.get(emotion, np.nan) for emotion in EmotionAnalyzer.EMOTIONS] for overall in emotions],
+                dtype=np.float64,
+            ).reshape(len(articles), len(EmotionAnalyzer.EMOTIONS)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def top_emotions(self, index: int, k: int = 3) -> List[Tuple[str, float]]:
+        """Return the k highest-scoring emotions of one article, ties in EMOTIONS order."""
+        row = self.emotion_matrix[index].tolist()
+        scored = ((emotion, score) for emotion, score in zip(EmotionAnalyzer.EMOTIONS, row) if not math.isnan(score))
+        return heapq.nlargest(k, scored, key=itemgetter(1))
+
+
+def _column(values: Iterable) -> np.ndarray:
+    """Store arbitrary per-article values in a 1-D object array."""
+    values = list(values)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def combined_analyze(
+    articles: Iterable[Dict],
+    fields: List[str] = None,
+    sentiment_analyzer: Optional[SentimentAnalyzer] = None,
+    emotion_analyzer: Optional[EmotionAnalyzer] = None,
+    batch_size: int = 32,
+    inplace: bool = False,
+) -> List[Dict]:
+    """
+    Analyze sentiment and emotion in one pass and return the merged articles.
+
+    Each returned article carries both "sentiment_analysis" and
+    "emotion_analysis", so no separate per-analyzer results need zipping.
+    With inplace=True both analyses are written into the input dictionaries
+    instead of into copies.
+    """
+    combined = CombinedAnalyzer(sentiment_analyzer, emotion_analyzer)
+    return combined.analyze_articles(articles, fields=fields, batch_size=batch_size, inplace=inplace)
+
+
+def _shares_backbone(first, second) -> bool:
+    """True when both transformer pipelines wrap PyTorch heads on identical encoder weights."""
+    if first.runtime not in TORCH_RUNTIMES or second.runtime not in TORCH_RUNTIMES:
+        return False
+    first_tokenizer, second_tokenizer = _shared_tokenizer(first), _shared_tokenizer(second)
+    if first_tokenizer is None or second_tokenizer is None:
+        return False
+    if not _tokenizers_compatible(first_tokenizer, second_tokenizer):
+        return False
+
+    first_model, second_model = first.model.model, second.model.model
+    if torch is None or not all(isinstance(model, torch.nn.Module) for model in (first_model, second_model)):
+        return False
+    model_type = getattr(first_model.config, "model_type", None)
+    if model_type not in SHARED_HEAD_MODEL_TYPES or second_model.config.model_type != model_type:
+        return False
+
+    first_state = first_model.base_model.state_dict()
+    second_state = second_model.base_model.state_dict()
+    if not first_state or first_state.keys() != second_state.keys():
+        return False
+    return all(torch.equal(first_state[name], second_state[name]) for name in first_state)
+
+
+def _classifier_logits(model, base_outputs):
+    """Apply a sequence-classification head to precomputed encoder outputs (eval mode)."""
+    model_type = model.config.model_type
+    hidden_states = base_outputs[0]
+    if model_type == "distilbert":
+        return model.classifier(torch.relu(model.pre_classifier(hidden_states[:, 0])))
+    if model_type == "bert":
+        return model.classifier(base_outputs[1])
+    return model.classifier(hidden_states)
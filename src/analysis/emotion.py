@@ -4,23 +4,32 @@ Detects specific emotions (anger, fear, joy, sadness, etc.) in text and
 falls back to a lexical model when transformers are unavailable.
 """
 
-import json
+from functools import lru_cache
 import os
 from pathlib import Path
-from typing import Dict, List
+import sys
+from typing import Dict, Iterable, List, Literal, Tuple
 import warnings
 
-from tqdm import tqdm
+import numpy as np
 
-try:
-    from transformers import pipeline
-except Exception:  # pragma: no cover - optional dependency failure
-    pipeline = None
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analysis.article_io import (
+    load_articles_from_json,
+    save_analyzed_articles_ndjson,
+    write_articles_payload,
+)
+from src.analysis.batch_analyzer import BatchAnalyzerMixin
+from src.analysis.model_runtime import load_text_classifier, transformers_available
+from src.analysis.rounding import round_floats
+from src.utils.inference_cache import get_inference_cache
 
 warnings.filterwarnings("ignore")
 
 
-class EmotionAnalyzer:
+class EmotionAnalyzer(BatchAnalyzerMixin):
     """Analyze emotions in text using transformers or lexical rules."""
 
     EMOTIONS = [
@@ -28,6 +37,19 @@ class EmotionAnalyzer:
         "neutral", "sadness", "surprise"
     ]
 
+    TEXT_CACHE_SIZE = 4096
+    ANALYSIS_NAME = "emotion"
+
+    MODEL_SIZES = {
+        "base": "j-hartmann/emotion-english-distilroberta-base",
+        "small": "bhadresh-savani/distilbert-base-uncased-emotion",
+    }
+
+    # Model labels that are not part of EMOTIONS, folded onto the closest one.
+    LABEL_MAP = {
+        "love": "joy",
+    }
+
     EMOTION_KEYWORDS = {
         "anger": {"anger", "angry", "furious", "aggression", "rage", "frustration"},
         "disgust": {"disgust", "corruption", "snub", "biased", "unacceptable"},
@@ -40,42 +62,67 @@ class EmotionAnalyzer:
 
     def __init__(
         self,
-        model_name: str = "j-hartmann/emotion-english-distilroberta-base",
+        model_name: str | None = None,
         prefer_transformers: bool | None = None,
+        model_size: Literal["base", "small"] = "base",
     ):
         """
         Initialize emotion analyzer.
 
         Args:
-            model_name: Hugging Face model for emotion detection
+            model_name: Hugging Face model for emotion detection. When None,
+                the model is chosen from MODEL_SIZES by model_size.
             prefer_transformers: Force or disable transformer usage. When None,
                 the analyzer prefers the heuristic backend unless
                 GNS_ENABLE_TRANSFORMERS=1 is set.
+            model_size: "base" (the default) selects the 7-label DistilRoBERTa
+                model (~82M parameters, best accuracy). "small" opts into a
+                6-label DistilBERT model (~66M parameters, roughly 40% faster
+                on CPU) that reports "love" as joy and has no disgust or
+                neutral class, so those scores are always 0.0 and never
+                become the dominant emotion.
         """
+        if model_name is None:
+            model_name = self.MODEL_SIZES[model_size]
+
         env_pref = os.getenv("GNS_ENABLE_TRANSFORMERS", "0") == "1"
         self.prefer_transformers = env_pref if prefer_transformers is None else prefer_transformers
         self.backend = "heuristic"
         self.model = None
+        self.runtime = None
+        self.inference_cache = None
+        self.model_key = None
+        self._analyze_cached = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._analyze_uncached)
 
-        if self.prefer_transformers and pipeline is not None:
+        if self.prefer_transformers and transformers_available():
             try:
-                os.environ.setdefault("DISABLE_SAFETENSORS_CONVERSION", "1")
                 print(f"Loading emotion model: {model_name}")
                 print("(Using transformer backend)")
-                self.model = pipeline(
+                self.model, self.runtime = load_text_classifier(
                     "text-classification",
-                    model=model_name,
+                    model_name,
                     top_k=None,
-                    device=-1,
-                    use_safetensors=False,
                 )
                 self.backend = "transformers"
-                print("Emotion model loaded successfully")
+                self.model_key = f"{model_name}:{self.runtime}"
+                if os.getenv("GNS_INFERENCE_CACHE", "1") != "0":
+                    self.inference_cache = get_inference_cache()
+                print(f"Emotion model loaded successfully ({self.runtime} runtime)")
             except Exception as exc:
                 print(f"Falling back to heuristic emotion analysis: {exc}")
         else:
             print("Using heuristic emotion analyzer")
 
+    @classmethod
+    def preload(cls, **kwargs) -> "EmotionAnalyzer":
+        """
+        Build an analyzer at script start so its model is loaded before first use.
+
+        Takes the same arguments as the constructor. The pipeline is kept in
+        the process-wide model registry, so later analyzers reuse it.
+        """
+        return cls(**kwargs)
+
     def analyze_text(self, text: str) -> Dict[str, float]:
         """
         Analyze emotions in a single text.
@@ -89,27 +136,28 @@ class EmotionAnalyzer:
         if not text or not text.strip():
             return {emotion: 0.0 for emotion in self.EMOTIONS}
 
-        text = text[:512]
-
-        if self.backend == "transformers" and self.model is not None:
-            try:
-                results = self.model(text)[0]
-                return {
-                    result["label"]: round(result["score"], 4)
-                    for result in results
-                }
-            except Exception as exc:
-                print(f"Error analyzing emotions with transformers: {exc}")
-
-        return self._analyze_text_heuristic(text)
+        return round_floats(dict(self._analyze_cached(text[:512])))
 
-    def analyze_articles(self, articles: List[Dict], fields: List[str] = None) -> List[Dict]:
+    def analyze_articles(
+        self,
+        articles: Iterable[Dict],
+        fields: List[str] = None,
+        batch_size: int = 32,
+        inplace: bool = False,
+    ) -> List[Dict]:
         """
         Analyze emotions in news articles.
 
+        Every non-empty field of every article is scored in one batched pass,
+        so the transformer backend runs a handful of large forward passes
+        instead of one call per field per article.
+
         Args:
-            articles: List of article dictionaries
+            articles: Article dictionaries (any iterable)
             fields: Which fields to analyze
+            batch_size: Number of texts per transformer forward pass
+            inplace: Write results into the input dictionaries instead of
+                shallow copies (saves one dict copy per article)
 
         Returns:
             Articles with added emotion analysis
@@ -117,42 +165,12 @@ class EmotionAnalyzer:
         if fields is None:
             fields = ["title", "description"]
 
+        if not isinstance(articles, list):
+            articles = list(articles)
         print(f"\nAnalyzing emotions in {len(articles)} articles...")
         print(f"Fields to analyze: {fields}")
 
-        analyzed_articles = []
-
-        for article in tqdm(articles, desc="Analyzing emotions"):
-            article_copy = article.copy()
-            article_copy["emotion_analysis"] = {}
-
-            for field in fields:
-                text = article.get(field, "")
-                if text and text.strip():
-                    article_copy["emotion_analysis"][field] = self.analyze_text(text)
-
-            if article_copy["emotion_analysis"]:
-                overall_emotions = {}
-
-                for emotion in self.EMOTIONS:
-                    scores = []
-                    for field_emotions in article_copy["emotion_analysis"].values():
-                        if emotion in field_emotions:
-                            scores.append(field_emotions[emotion])
-
-                    if scores:
-                        overall_emotions[emotion] = round(sum(scores) / len(scores), 4)
-
-                if overall_emotions:
-                    dominant = max(overall_emotions.items(), key=lambda item: item[1])
-                    overall_emotions["dominant_emotion"] = dominant[0]
-                    overall_emotions["dominant_score"] = dominant[1]
-
-                article_copy["emotion_analysis"]["overall"] = overall_emotions
-
-            analyzed_articles.append(article_copy)
-
-        return analyzed_articles
+        return self._analyze_article_chunk(articles, fields, batch_size, inplace)
 
     def get_emotion_statistics(self, analyzed_articles: List[Dict]) -> Dict:
         """
@@ -167,45 +185,149 @@ class EmotionAnalyzer:
         if not analyzed_articles:
             return {}
 
-        emotion_totals = {emotion: [] for emotion in self.EMOTIONS}
-        dominant_emotions = []
+        scores = np.zeros((len(analyzed_articles), len(self.EMOTIONS)))
+        present = np.zeros(scores.shape, dtype=bool)
+        dominant_ids = []
+        dominant_vocab: Dict[str, int] = {}
 
-        for article in analyzed_articles:
+        for row, article in enumerate(analyzed_articles):
             overall = article.get("emotion_analysis", {}).get("overall", {})
 
             if overall:
-                for emotion in self.EMOTIONS:
+                for column, emotion in enumerate(self.EMOTIONS):
                     if emotion in overall:
-                        emotion_totals[emotion].append(overall[emotion])
+                        scores[row, column] = overall[emotion]
+                        present[row, column] = True
 
                 if "dominant_emotion" in overall:
-                    dominant_emotions.append(overall["dominant_emotion"])
+                    dominant = overall["dominant_emotion"]
+                    dominant_ids.append(dominant_vocab.setdefault(dominant, len(dominant_vocab)))
 
+        counts = present.sum(axis=0)
+        averages = np.divide(scores.sum(axis=0), counts, out=np.zeros(len(self.EMOTIONS)), where=counts > 0)
+        averages = np.round(averages, 4)
         emotion_averages = {
-            emotion: round(sum(scores) / len(scores), 4) if scores else 0.0
-            for emotion, scores in emotion_totals.items()
+            emotion: float(averages[column])
+            for column, emotion in enumerate(self.EMOTIONS)
         }
-        dominant_counts = {
-            emotion: dominant_emotions.count(emotion)
-            for emotion in set(dominant_emotions)
-        }
-        dominant_sorted = sorted(
-            dominant_counts.items(),
-            key=lambda item: item[1],
-            reverse=True
-        )
+        # Dominant emotions are numbered in first-seen order, so a stable sort
+        # by count breaks ties the same way Counter.most_common does.
+        dominant_names = list(dominant_vocab)
+        dominant_counts = np.bincount(np.array(dominant_ids, dtype=np.int64), minlength=len(dominant_names))
+        dominant_percents = dominant_counts / max(len(dominant_ids), 1) * 100
+        dominant_order = np.argsort(-dominant_counts, kind="stable")
 
         return {
             "total_analyzed": len(analyzed_articles),
             "average_emotions": emotion_averages,
-            "dominant_emotion_counts": dict(dominant_sorted),
-            "most_common_emotion": dominant_sorted[0][0] if dominant_sorted else None,
+            "dominant_emotion_counts": {
+                dominant_names[index]: int(dominant_counts[index]) for index in dominant_order
+            },
+            "most_common_emotion": dominant_names[dominant_order[0]] if dominant_names else None,
             "emotion_distribution": {
-                emotion: round(count / len(dominant_emotions) * 100, 2)
-                for emotion, count in dominant_counts.items()
-            } if dominant_emotions else {}
+                emotion: round(float(dominant_percents[index]), 2)
+                for index, emotion in enumerate(dominant_names)
+            },
         }
 
+    def _apply_scores(
+        self,
+        articles: List[Dict],
+        entries: List[Tuple[int, str, str]],
+        unique_scores: Dict[str, Dict],
+        inplace: bool,
+    ) -> List[Dict]:
+        """Scatter per-text scores into "emotion_analysis" and add the overall result."""
+        analyzed_articles = []
+        for article in articles:
+            article_copy = article if inplace else article.copy()
+            article_copy["emotion_analysis"] = {}
+            analyzed_articles.append(article_copy)
+
+        for index, field, text in entries:
+            analyzed_articles[index]["emotion_analysis"][field] = dict(unique_scores[text])
+
+        for index, overall in self._overall_emotions(len(articles), entries, unique_scores).items():
+            analyzed_articles[index]["emotion_analysis"]["overall"] = overall
+
+        return analyzed_articles
+
+    def _analyze_uncached(self, text: str) -> Tuple[Tuple[str, float], ...]:
+        """Score one truncated text; wrapped in an LRU cache by __init__."""
+        if self.backend == "transformers" and self.model is not None:
+            try:
+                return tuple(self._normalize_scores(self._run_model(text)[0]).items())
+            except Exception as exc:
+                print(f"Error analyzing emotions with transformers: {exc}")
+
+        return tuple(self._analyze_text_heuristic(text).items())
+
+    def _overall_emotions(
+        self,
+        n_articles: int,
+        entries: List[Tuple[int, str, str]],
+        unique_scores: Dict[str, Dict],
+    ) -> Dict[int, Dict]:
+        """
+        Average per-field scores and pick the dominant emotion for every article at once.
+
+        Field scores are gathered into an (n_articles, len(EMOTIONS)) array so
+        the averages and the dominant-emotion argmax run as single NumPy calls.
+        Returns overall results keyed by the index of each article that had
+        at least one scored field.
+        """
+        if not entries:
+            return {}
+
+        texts = list(unique_scores)
+        text_rows = {text: row for row, text in enumerate(texts)}
+        text_scores = np.array(
+            [[unique_scores[text].get(emotion, np.nan) for emotion in self.EMOTIONS] for text in texts],
+            dtype=float,
+        )
+        article_rows = np.array([index for index, _, _ in entries], dtype=np.intp)
+        field_scores = text_scores[[text_rows[text] for _, _, text in entries]]
+        field_present = ~np.isnan(field_scores)
+
+        totals = np.zeros((n_articles, len(self.EMOTIONS)))
+        counts = np.zeros((n_articles, len(self.EMOTIONS)))
+        np.add.at(totals, article_rows, np.where(field_present, field_scores, 0.0))
+        np.add.at(counts, article_rows, field_present)
+
+        present = counts > 0
+        averages = np.divide(totals, counts, out=np.zeros_like(totals), where=present)
+        dominants = np.where(present, averages, -np.inf).argmax(axis=1)
+
+        overall_by_article = {}
+        for index in dict.fromkeys(article_rows.tolist()):
+            if not present[index].any():
+                overall_by_article[index] = {}
+                continue
+            overall_emotions = {
+                emotion: float(averages[index, position])
+                for position, emotion in enumerate(self.EMOTIONS)
+                if present[index, position]
+            }
+            dominant = int(dominants[index])
+            overall_emotions["dominant_emotion"] = self.EMOTIONS[dominant]
+            overall_emotions["dominant_score"] = float(averages[index, dominant])
+            overall_by_article[index] = overall_emotions
+        return overall_by_article
+
+    def _scores_from_label_scores(self, label_scores: List[Dict]) -> Dict[str, float]:
+        """Convert a full list of model label scores into this analyzer's result."""
+        return self._normalize_scores(label_scores)
+
+    def _normalize_scores(self, results: List[Dict]) -> Dict[str, float]:
+        """Map model labels onto EMOTIONS, merging labels listed in LABEL_MAP."""
+        scores = {emotion: 0.0 for emotion in self.EMOTIONS}
+        for result in results:
+            label = str(result["label"]).lower()
+            label = self.LABEL_MAP.get(label, label)
+            if label in scores:
+                scores[label] += result["score"]
+        return scores
+
     def _analyze_text_heuristic(self, text: str) -> Dict[str, float]:
         """Estimate emotion scores using keyword matches."""
         lowered = text.lower()
@@ -220,33 +342,20 @@ class EmotionAnalyzer:
 
         total = sum(raw_scores.values()) or 1.0
         return {
-            emotion: round(raw_scores.get(emotion, 0.0) / total, 4)
+            emotion: raw_scores.get(emotion, 0.0) / total
             for emotion in self.EMOTIONS
         }
 
 
-def load_articles_from_json(filepath: str) -> List[Dict]:
-    """Load articles from JSON file."""
-    with open(filepath, "r", encoding="utf-8") as handle:
-        data = json.load(handle)
-
-    if isinstance(data, dict) and "articles" in data:
-        return data["articles"]
-    if isinstance(data, list):
-        return data
-    return []
-
-
 def save_analyzed_articles(articles: List[Dict], output_path: str):
     """Save analyzed articles to JSON file."""
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_file, "w", encoding="utf-8") as handle:
-        json.dump({
+    write_articles_payload(
+        {
             "total_articles": len(articles),
-            "articles": articles
-        }, handle, indent=2, ensure_ascii=False)
+            "articles": articles,
+        },
+        output_path,
+    )
 
     print(f"Saved emotion analysis to: {output_path}")
 
@@ -0,0 +1,285 @@
+"""
+Transformer runtime helpers shared by the sentiment and emotion analyzers.
+Builds Hugging Face text-classification pipelines: pinned to the GPU when
+CUDA is available, otherwise preferring an ONNX Runtime export of the model
+when optimum is installed.
+"""
+
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import threading
+from typing import Dict, Tuple
+
+try:
+    import torch
+except Exception:  # pragma: no cover - optional dependency failure
+    torch = None
+
+try:
+    from transformers import AutoTokenizer, pipeline
+except Exception:  # pragma: no cover - optional dependency failure
+    AutoTokenizer = None
+    pipeline = None
+
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except Exception:  # pragma: no cover - optional dependency failure
+    onnxruntime = None
+    ORTModelForSequenceClassification = None
+    ORTQuantizer = None
+    AutoQuantizationConfig = None
+
+ONNX_CACHE_DIR = Path("models/onnx")
+AUTOCAST_RUNTIMES = {
+    "torch-bf16": ("cpu", "bfloat16"),
+    "cuda-bf16": ("cuda", "bfloat16"),
+    "cuda-fp16": ("cuda", "float16"),
+}
+# Runtimes whose pipeline wraps a PyTorch nn.Module (as opposed to an ONNX session).
+TORCH_RUNTIMES = {"torch", "torch-int8", "torch-bf16", "cuda-bf16", "cuda-fp16"}
+RUNTIME_ENV_VARS = (
+    "GNS_TRANSFORMER_RUNTIME",
+    "GNS_QUANTIZE",
+    "GNS_BF16",
+    "GNS_TORCH_COMPILE",
+    "GNS_CUDA_DEVICE",
+)
+
+# Loaded pipelines, shared by every analyzer built in this process.
+_MODELS: Dict[Tuple, Tuple[object, str]] = {}
+_MODELS_LOCK = threading.Lock()
+
+
+def transformers_available() -> bool:
+    """Return True when the transformers pipeline API can be imported."""
+    return pipeline is not None
+
+
+@contextmanager
+def inference_context(runtime: str | None = None):
+    """
+    Disable autograd bookkeeping for inference.
+
+    Reduced-precision runtimes also run the forward pass under autocast:
+    "torch-bf16" on the CPU, "cuda-bf16"/"cuda-fp16" on the GPU.
+    """
+    if torch is None:
+        yield
+        return
+
+    autocast = AUTOCAST_RUNTIMES.get(runtime or "")
+    with torch.inference_mode():
+        if autocast is not None:
+            device_type, dtype_name = autocast
+            with torch.autocast(device_type, dtype=getattr(torch, dtype_name)):
+                yield
+        else:
+            yield
+
+
+def load_text_classifier(task: str, model_name: str, **pipeline_kwargs):
+    """
+    Return the text-classification pipeline for the given model.
+
+    Pipelines are loaded once per process and kept in a registry keyed by
+    task, model, pipeline options and the GNS_* runtime settings, so
+    constructing another analyzer reuses the weights already in memory.
+    """
+    key = (
+        task,
+        model_name,
+        tuple(sorted(pipeline_kwargs.items())),
+        tuple(os.getenv(name, "") for name in RUNTIME_ENV_VARS),
+    )
+    with _MODELS_LOCK:
+        if key not in _MODELS:
+            _MODELS[key] = _build_text_classifier(task, model_name, **pipeline_kwargs)
+        return _MODELS[key]
+
+
+def _build_text_classifier(task: str, model_name: str, **pipeline_kwargs):
+    """
+    Build a text-classification pipeline for the given model.
+
+    On a CUDA machine the PyTorch model is pinned to GPU 0 (GNS_CUDA_DEVICE
+    picks another index, -1 forces the CPU), loaded in BF16 (FP16 on
+    pre-Ampere cards) and run under CUDA autocast. On the CPU, ONNX Runtime
+    is used when optimum is available and GNS_TRANSFORMER_RUNTIME is not set
+    to "torch"; otherwise the PyTorch model runs in BF16 on CPUs with native
+    BF16 support unless GNS_BF16=0. PyTorch models are compiled with
+    torch.compile unless GNS_TORCH_COMPILE=0.
+    Setting GNS_QUANTIZE=1 swaps the CPU model (ONNX or PyTorch) for a
+    dynamically quantized INT8 copy; leave it unset to keep FP32 for
+    accuracy comparisons. Dynamic INT8 quantization is CPU-only, so on a
+    GPU the half-precision CUDA path takes precedence and GNS_QUANTIZE=1 is
+    ignored with a notice.
+    Returns a (pipeline, runtime_name) tuple.
+    """
+    if pipeline is None:
+        raise RuntimeError("transformers is not installed")
+
+    device = _pipeline_device()
+    # The ONNX export runs on the CPU provider, so it only wins when no GPU is in use
+    # (or when GNS_TRANSFORMER_RUNTIME=onnx asks for it explicitly).
+    runtime_pref = os.getenv("GNS_TRANSFORMER_RUNTIME", "auto").lower()
+    use_onnx = runtime_pref == "onnx" or (runtime_pref != "torch" and device < 0)
+    if use_onnx and ORTModelForSequenceClassification is not None:
+        try:
+            return _load_onnx_classifier(task, model_name, **pipeline_kwargs)
+        except Exception as exc:
+            print(f"ONNX Runtime unavailable for {model_name}, using PyTorch: {exc}")
+
+    os.environ.setdefault("DISABLE_SAFETENSORS_CONVERSION", "1")
+    _configure_torch_threads()
+    if device >= 0:
+        # Load the weights directly in half precision on the GPU.
+        pipeline_kwargs.setdefault("torch_dtype", _cuda_half_dtype())
+
+    classifier = pipeline(
+        task,
+        model=model_name,
+        device=device,
+        use_safetensors=False,
+        **pipeline_kwargs,
+    )
+    if device >= 0:
+        runtime = "cuda-bf16" if pipeline_kwargs["torch_dtype"] == torch.bfloat16 else "cuda-fp16"
+        if os.getenv("GNS_QUANTIZE", "0") == "1":
+            print(f"GNS_QUANTIZE=1 ignored for {model_name}: INT8 quantization is CPU-only, using {runtime} on GPU {device}")
+    elif os.getenv("GNS_QUANTIZE", "0") == "1":
+        _quantize_dynamic_int8(classifier)
+        runtime = "torch-int8"
+    elif _bf16_enabled():
+        _optimize_bf16(classifier)
+        runtime = "torch-bf16"
+    else:
+        runtime = "torch"
+    _compile_model(classifier, runtime)
+    return classifier, runtime
+
+
+def _configure_torch_threads() -> None:
+    """Use one intra-op thread per core (GNS_TORCH_THREADS overrides) and no inter-op pool."""
+    if torch is None:
+        return
+
+    torch.set_num_threads(int(os.getenv("GNS_TORCH_THREADS", os.cpu_count() or 1)))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable once per process, before any inter-op work has run.
+        pass
+
+
+def _quantize_dynamic_int8(classifier) -> None:
+    """Replace the model's nn.Linear layers with dynamically quantized INT8 versions."""
+    classifier.model = torch.ao.quantization.quantize_dynamic(
+        classifier.model.eval(),
+        {torch.nn.Linear},
+        dtype=torch.qint8,
+    )
+
+
+def _pipeline_device() -> int:
+    """Pipeline device: GPU 0 (or GNS_CUDA_DEVICE) when CUDA is available, else -1 (CPU)."""
+    if torch is None or not torch.cuda.is_available():
+        return -1
+    return int(os.getenv("GNS_CUDA_DEVICE", "0"))
+
+
+def _cuda_half_dtype():
+    """BF16 on GPUs that support it (Ampere and newer), FP16 otherwise."""
+    return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+
+def _bf16_enabled() -> bool:
+    """Use BF16 only where the CPU has native BF16 instructions (AVX512-BF16 or AMX)."""
+    if torch is None or os.getenv("GNS_BF16", "auto").lower() in {"0", "false", "off"}:
+        return False
+
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as handle:
+            cpu_flags = handle.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in cpu_flags or "amx_bf16" in cpu_flags
+
+
+def _optimize_bf16(classifier) -> None:
+    """Apply Intel Extension for PyTorch BF16 kernels when it is installed."""
+    try:
+        import intel_extension_for_pytorch as ipex
+    except Exception:
+        return
+
+    classifier.model = ipex.optimize(classifier.model.eval(), dtype=torch.bfloat16)
+
+
+def _compile_model(classifier, runtime: str = "torch") -> None:
+    """
+    Compile the pipeline's PyTorch model and absorb compilation with a warm-up call.
+
+    torch.compile is lazy, so failures only surface on the first forward
+    pass; the warm-up runs here and restores the eager model if it fails.
+    """
+    if torch is None or not hasattr(torch, "compile") or os.getenv("GNS_TORCH_COMPILE", "1") == "0":
+        return
+
+    eager_model = classifier.model
+    try:
+        classifier.model = torch.compile(eager_model, mode="reduce-overhead", fullgraph=False)
+        with inference_context(runtime):
+            classifier("warmup")
+    except Exception as exc:
+        print(f"torch.compile unavailable, using eager model: {exc}")
+        classifier.model = eager_model
+
+
+def _load_onnx_classifier(task: str, model_name: str, **pipeline_kwargs):
+    """Load (exporting once if needed) an ONNX model and wrap it in a pipeline."""
+    onnx_dir = ONNX_CACHE_DIR / model_name
+    if not (onnx_dir / "model.onnx").exists():
+        _export_onnx(model_name, onnx_dir)
+
+    model_dir, file_name, runtime = onnx_dir, "model.onnx", "onnx"
+    if os.getenv("GNS_QUANTIZE", "0") == "1":
+        model_dir, file_name, runtime = _quantize_if_needed(onnx_dir), "model_quantized.onnx", "onnx-int8"
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    session_options.intra_op_num_threads = os.cpu_count() or 1
+
+    model = ORTModelForSequenceClassification.from_pretrained(
+        model_dir,
+        file_name=file_name,
+        provider="CPUExecutionProvider",
+        session_options=session_options,
+    )
+    tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+    return pipeline(task, model=model, tokenizer=tokenizer, **pipeline_kwargs), runtime
+
+
+def _export_onnx(model_name: str, onnx_dir: Path) -> None:
+    """Export a Hugging Face checkpoint to ONNX and cache it on disk."""
+    print(f"Exporting {model_name} to ONNX (first run only)")
+    model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    onnx_dir.mkdir(parents=True, exist_ok=True)
+    model.save_pretrained(onnx_dir)
+    tokenizer.save_pretrained(onnx_dir)
+
+
+def _quantize_if_needed(onnx_dir: Path) -> Path:
+    """Write a dynamic INT8 copy of an exported model next to the FP32 one."""
+    quantized_dir = onnx_dir.with_name(f"{onnx_dir.name}_int8")
+    if not (quantized_dir / "model_quantized.onnx").exists():
+        print(f"Quantizing {onnx_dir} to INT8 (first run only)")
+        quantizer = ORTQuantizer.from_pretrained(onnx_dir)
+        quantizer.quantize(
+            save_dir=quantized_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+        )
+    return quantized_dir
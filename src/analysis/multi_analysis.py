@@ -0,0 +1,324 @@
+"""
+Run several article analyzers over one shared pre-processing pass.
+Texts are collected, truncated and deduplicated once, and transformer
+analyzers whose tokenizers match share one tokenization per batch.
+Tokenization of the next batch is prefetched on a background thread, and
+large article sets can also be sharded across worker processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+import multiprocessing
+import os
+from pathlib import Path
+import queue
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type
+
+from tqdm import tqdm
+
+try:
+    import torch
+except Exception:  # pragma: no cover - optional dependency failure
+    torch = None
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analysis.article_texts import prepare_texts
+from src.analysis.model_runtime import inference_context
+from src.analysis.sentiment import SentimentAnalyzer
+
+PREFETCH_BATCHES = 2
+PREFETCH_POLL_SECONDS = 0.1
+WORKER_TORCH_THREADS = 2
+
+_worker_analyzer = None
+
+
+def analyze_articles_multi(
+    articles: Iterable[Dict],
+    analyzers: List,
+    fields: Optional[List[str]] = None,
+    batch_size: int = 32,
+    inplace: bool = False,
+) -> List[Dict]:
+    """
+    Analyze articles with every analyzer in `analyzers` (e.g. sentiment and emotion).
+
+    Produces the same output as calling each analyzer's analyze_articles in
+    turn, but the text collection and truncation pass runs once and
+    compatible transformer models reuse the same input_ids/attention_mask.
+    Transformer models that cannot share tokens run concurrently in
+    threads, so one model's tokenization overlaps the other's forward pass;
+    the torch thread budget is split between them for the duration.
+    The default sentiment checkpoint and the model_size="small" emotion
+    checkpoint both use the distilbert-base-uncased tokenizer, so together
+    they form a single tokenizer group.
+    """
+    if not isinstance(articles, list):
+        articles = list(articles)
+    if fields is None:
+        fields = ["title", "description"]
+
+    entries = prepare_texts(articles, fields)
+    unique_texts = list(dict.fromkeys(text for _, _, text in entries))
+
+    groups = _group_by_tokenizer(analyzers)
+    scores_by_analyzer = {}
+    if len(groups) > 1 and any(analyzer.backend == "transformers" for analyzer in analyzers):
+        # Separate models are independent; their forward passes release the GIL and overlap.
+        with _split_torch_threads(len(groups)), ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [executor.submit(_score_group, group, unique_texts, batch_size) for group in groups]
+            for future in futures:
+                scores_by_analyzer.update(future.result())
+    else:
+        for group in groups:
+            scores_by_analyzer.update(_score_group(group, unique_texts, batch_size))
+
+    analyzed_articles = articles if inplace else [article.copy() for article in articles]
+    for analyzer in analyzers:
+        unique_scores = dict(zip(unique_texts, scores_by_analyzer[id(analyzer)]))
+        analyzed_articles = analyzer._apply_scores(analyzed_articles, entries, unique_scores, True)
+    return analyzed_articles
+
+
+@contextmanager
+def _split_torch_threads(parts: int):
+    """
+    Share torch's intra-op thread budget between `parts` concurrent forward passes.
+
+    Every model is loaded with one intra-op thread per core; two passes each
+    asking for all of them would oversubscribe the CPU. The budget is
+    restored on exit. ONNX Runtime sessions keep their own thread pools.
+    """
+    if torch is None or parts < 2:
+        yield
+        return
+    total = torch.get_num_threads()
+    torch.set_num_threads(max(1, total // parts))
+    try:
+        yield
+    finally:
+        torch.set_num_threads(total)
+
+
+def _score_group(group: List, texts: List[str], batch_size: int) -> Dict[int, List[Dict]]:
+    """Score texts with one tokenizer group, keyed by id(analyzer)."""
+    scores = _analyze_shared_tokens(texts, group, batch_size) if len(group) > 1 else {}
+    for analyzer in group:
+        if id(analyzer) not in scores:
+            scores[id(analyzer)] = analyzer._analyze_texts(texts, batch_size=batch_size)
+    return scores
+
+
+def _group_by_tokenizer(analyzers: List) -> List[List]:
+    """Group analyzers so transformer models with identical tokenizers share a group."""
+    groups: List[List] = []
+    for analyzer in analyzers:
+        tokenizer = _shared_tokenizer(analyzer)
+        for group in groups:
+            group_tokenizer = _shared_tokenizer(group[0])
+            if tokenizer is not None and group_tokenizer is not None and _tokenizers_compatible(tokenizer, group_tokenizer):
+                group.append(analyzer)
+                break
+        else:
+            groups.append([analyzer])
+    return groups
+
+
+def _shared_tokenizer(analyzer):
+    """Return the analyzer's pipeline tokenizer if its model can take pre-tokenized input."""
+    if torch is None or analyzer.backend != "transformers" or analyzer.model is None:
+        return None
+    if not hasattr(analyzer.model, "model"):
+        return None
+    return getattr(analyzer.model, "tokenizer", None)
+
+
+def _tokenizers_compatible(first, second) -> bool:
+    """Tokenizers are interchangeable when class, max length and vocabulary all match."""
+    if first is second:
+        return True
+    return (
+        type(first) is type(second)
+        and first.model_max_length == second.model_max_length
+        and first.get_vocab() == second.get_vocab()
+    )
+
+
+def _analyze_shared_tokens(
+    texts: List[str],
+    analyzers: List,
+    batch_size: int,
+    logits_fn: Optional[Callable] = None,
+) -> Dict[int, List[Dict]]:
+    """
+    Tokenize each length-sorted batch once and run every analyzer's model on it.
+
+    logits_fn(batch) may replace the per-analyzer forward passes; it must
+    return one logits tensor per analyzer, in order. Texts every analyzer
+    already has in its inference cache skip the forward pass, and fresh
+    results are written back per analyzer. Returns results keyed by
+    id(analyzer); an empty dict if the direct forward pass fails, so
+    callers fall back to each analyzer's pipeline.
+    """
+    tokenizer = _shared_tokenizer(analyzers[0])
+    device = getattr(analyzers[0].model, "device", None)
+    pin = device is not None and device.type == "cuda"
+    cached = {id(analyzer): analyzer._cached_scores(texts) for analyzer in analyzers}
+    order = sorted(
+        (position for position in range(len(texts)) if any(position not in hits for hits in cached.values())),
+        key=lambda position: len(texts[position]),
+    )
+    results = {
+        id(analyzer): [cached[id(analyzer)].get(position, {}) for position in range(len(texts))]
+        for analyzer in analyzers
+    }
+    if logits_fn is None:
+        logits_fn = lambda batch: [analyzer.model.model(**batch).logits for analyzer in analyzers]
+
+    try:
+        batches = _prefetch(_tokenized_batches(tokenizer, texts, order, batch_size, pin))
+        for chunk, batch in tqdm(batches, total=-(-len(order) // batch_size), desc="Analyzing articles (shared tokens)"):
+            if pin:
+                batch = {key: value.to(device, non_blocking=True) for key, value in batch.items()}
+            with inference_context(analyzers[0].runtime):
+                all_logits = logits_fn(batch)
+            for analyzer, logits in zip(analyzers, all_logits):
+                probabilities = torch.softmax(logits.float(), dim=-1)
+                id2label = analyzer.model.model.config.id2label
+                hits = cached[id(analyzer)]
+                for position, row in zip(chunk, probabilities.tolist()):
+                    if position in hits:
+                        continue
+                    label_scores = sorted(
+                        ({"label": id2label[label_id], "score": score} for label_id, score in enumerate(row)),
+                        key=lambda item: item["score"],
+                        reverse=True,
+                    )
+                    results[id(analyzer)][position] = analyzer._scores_from_label_scores(label_scores)
+    except Exception as exc:
+        print(f"Shared tokenization failed, analyzing separately: {exc}")
+        return {}
+
+    for analyzer in analyzers:
+        hits = cached[id(analyzer)]
+        scores = results[id(analyzer)]
+        analyzer._store_scores({texts[position]: scores[position] for position in order if position not in hits})
+    return results
+
+
+def _tokenized_batches(tokenizer, texts: List[str], order: List[int], batch_size: int, pin: bool) -> Iterator:
+    """Yield (positions, encoded batch) for each batch of length-sorted texts."""
+    for start in range(0, len(order), batch_size):
+        chunk = order[start:start + batch_size]
+        batch = tokenizer(
+            [texts[position] for position in chunk],
+            padding=True,
+            truncation=True,
+            max_length=512,
+            return_tensors="pt",
+        )
+        if pin:
+            batch = {key: value.pin_memory() for key, value in batch.items()}
+        yield chunk, batch
+
+
+def _prefetch(items: Iterator, depth: int = PREFETCH_BATCHES) -> Iterator:
+    """
+    Run `items` on a background thread, keeping up to `depth` results ready.
+
+    Tokenizing batch N+1 then overlaps the forward pass of batch N; the fast
+    tokenizers and torch kernels both release the GIL. If the consumer stops
+    early (an exception or a closed generator), the producer thread notices
+    within PREFETCH_POLL_SECONDS and exits instead of blocking on a full queue.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    finished = object()
+    stop = threading.Event()
+
+    def offer(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=PREFETCH_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not offer(item):
+                    return
+        except Exception as exc:
+            offer(exc)
+            return
+        offer(finished)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is finished:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def analyze_articles_parallel(
+    articles: Iterable[Dict],
+    analyzer_cls: Type = SentimentAnalyzer,
+    analyzer_kwargs: Optional[Dict[str, Any]] = None,
+    fields: Optional[List[str]] = None,
+    batch_size: int = 32,
+    n_workers: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Shard articles across worker processes, each with its own loaded analyzer.
+
+    Every worker builds analyzer_cls(**analyzer_kwargs) once and is limited
+    to WORKER_TORCH_THREADS intra-op threads so the workers do not
+    oversubscribe the cores. Workers are spawned rather than forked, so
+    they never inherit a parent's initialized torch thread pool or CUDA
+    context; analyzer_cls and analyzer_kwargs must therefore be picklable.
+    Results come back in input order.
+    """
+    articles = list(articles)
+    analyzer_kwargs = analyzer_kwargs or {}
+    n_workers = n_workers or max(1, (os.cpu_count() or 2) // 2)
+    n_workers = min(n_workers, len(articles))
+
+    if n_workers <= 1:
+        return analyzer_cls(**analyzer_kwargs).analyze_articles(articles, fields=fields, batch_size=batch_size)
+
+    shard_size = -(-len(articles) // n_workers)
+    shards = [articles[start:start + shard_size] for start in range(0, len(articles), shard_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(analyzer_cls, analyzer_kwargs),
+    ) as executor:
+        results = executor.map(_analyze_shard, shards, [fields] * len(shards), [batch_size] * len(shards))
+        return [article for shard in results for article in shard]
+
+
+def _init_worker(analyzer_cls: Type, analyzer_kwargs: Dict[str, Any]) -> None:
+    """Load one analyzer per worker process."""
+    global _worker_analyzer
+    os.environ["GNS_TORCH_THREADS"] = str(WORKER_TORCH_THREADS)
+    if torch is not None:
+        torch.set_num_threads(WORKER_TORCH_THREADS)
+    _worker_analyzer = analyzer_cls(**analyzer_kwargs)
+
+
+def _analyze_shard(articles: List[Dict], fields: Optional[List[str]], batch_size: int) -> List[Dict]:
+    """Analyze one shard in a worker; the shard is a pickled copy, so write in place."""
+    return _worker_analyzer.analyze_articles(articles, fields=fields, batch_size=batch_size, inplace=True)
@@ -0,0 +1,20 @@
+"""
+Output rounding for analyzer scores.
+The batch analysis paths keep full-precision floats internally; results are
+rounded once here when they are returned from a single-text API or written.
+"""
+
+from typing import Any
+
+SCORE_DIGITS = 4
+
+
+def round_floats(value: Any, ndigits: int = SCORE_DIGITS) -> Any:
+    """Return a copy of nested dicts/lists with every float rounded to ndigits."""
+    if isinstance(value, float):
+        return round(value, ndigits)
+    if isinstance(value, dict):
+        return {key: round_floats(item, ndigits) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_floats(item, ndigits) for item in value]
+    return value
@@ -4,23 +4,33 @@ Analyzes sentiment (positive/negative/neutral) in news articles and comments.
 Falls back to a deterministic lexical model when transformers are unavailable.
 """
 
-import json
+from functools import lru_cache
 import os
 from pathlib import Path
-from typing import Dict, List, Union
+import sys
+from typing import Dict, Iterable, List, Tuple, Union
 import warnings
 
+import numpy as np
 from tqdm import tqdm
 
-try:
-    from transformers import pipeline
-except Exception:  # pragma: no cover - optional dependency failure
-    pipeline = None
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analysis.article_io import (
+    load_articles_from_json,
+    save_analyzed_articles_ndjson,
+    write_articles_payload,
+)
+from src.analysis.batch_analyzer import BatchAnalyzerMixin
+from src.analysis.model_runtime import load_text_classifier, transformers_available
+from src.analysis.rounding import round_floats
+from src.utils.inference_cache import get_inference_cache
 
 warnings.filterwarnings("ignore")
 
 
-class SentimentAnalyzer:
+class SentimentAnalyzer(BatchAnalyzerMixin):
     """Analyze sentiment in text using transformers or a lexical fallback."""
 
     POSITIVE_WORDS = {
@@ -39,6 +49,10 @@ class SentimentAnalyzer:
         "uncertain", "developing", "reportedly", "may", "might", "could",
         "risk", "volatile", "questions", "warning", "fragile", "tensions",
     }
+    LABELS = ("POSITIVE", "NEGATIVE", "NEUTRAL")
+    LABEL_IDS = {label: label_id for label_id, label in enumerate(LABELS)}
+    TEXT_CACHE_SIZE = 4096
+    ANALYSIS_NAME = "sentiment"
 
     def __init__(
         self,
@@ -58,25 +72,39 @@ class SentimentAnalyzer:
         self.prefer_transformers = env_pref if prefer_transformers is None else prefer_transformers
         self.backend = "heuristic"
         self.model = None
+        self.runtime = None
+        self.inference_cache = None
+        self.model_key = None
+        self._analyze_cached = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._analyze_uncached)
 
-        if self.prefer_transformers and pipeline is not None:
+        if self.prefer_transformers and transformers_available():
             try:
-                os.environ.setdefault("DISABLE_SAFETENSORS_CONVERSION", "1")
                 print(f"Loading sentiment model: {model_name}")
                 print("(Using transformer backend)")
-                self.model = pipeline(
+                self.model, self.runtime = load_text_classifier(
                     "sentiment-analysis",
-                    model=model_name,
-                    device=-1,
-                    use_safetensors=False,
+                    model_name,
                 )
                 self.backend = "transformers"
-                print("Sentiment model loaded successfully")
+                self.model_key = f"{model_name}:{self.runtime}"
+                if os.getenv("GNS_INFERENCE_CACHE", "1") != "0":
+                    self.inference_cache = get_inference_cache()
+                print(f"Sentiment model loaded successfully ({self.runtime} runtime)")
             except Exception as exc:
                 print(f"Falling back to heuristic sentiment analysis: {exc}")
         else:
             print("Using heuristic sentiment analyzer")
 
+    @classmethod
+    def preload(cls, **kwargs) -> "SentimentAnalyzer":
+        """
+        Build an analyzer at script start so its model is loaded before first use.
+
+        Takes the same arguments as the constructor. The pipeline is kept in
+        the process-wide model registry, so later analyzers reuse it.
+        """
+        return cls(**kwargs)
+
     def analyze_text(self, text: str) -> Dict[str, Union[str, float]]:
         """
         Analyze sentiment of a single text.
@@ -90,20 +118,7 @@ class SentimentAnalyzer:
         if not text or not text.strip():
             return {"label": "NEUTRAL", "score": 0.0}
 
-        text = text[:512]
-
-        if self.backend == "transformers" and self.model is not None:
-            try:
-                result = self.model(text)[0]
-                base_result = {
-                    "label": result["label"],
-                    "score": round(result["score"], 4)
-                }
-                return self._augment_transformer_result(base_result)
-            except Exception as exc:
-                print(f"Error analyzing text with transformers: {exc}")
-
-        return self._analyze_text_heuristic(text)
+        return round_floats(dict(self._analyze_cached(text[:512])))
 
     def analyze_batch(self, texts: List[str], batch_size: int = 8) -> List[Dict]:
         """
@@ -129,11 +144,11 @@ class SentimentAnalyzer:
 
             if self.backend == "transformers" and self.model is not None:
                 try:
-                    batch_results = self.model(cleaned_batch)
+                    batch_results = self._run_model(cleaned_batch)
                     results.extend([
                         {
                             "label": result["label"],
-                            "score": round(result["score"], 4)
+                            "score": result["score"]
                         }
                         for result in batch_results
                     ])
@@ -143,15 +158,28 @@ class SentimentAnalyzer:
 
             results.extend([self._analyze_text_heuristic(text) for text in batch])
 
-        return results
+        return round_floats(results)
 
-    def analyze_articles(self, articles: List[Dict], fields: List[str] = None) -> List[Dict]:
+    def analyze_articles(
+        self,
+        articles: Iterable[Dict],
+        fields: List[str] = None,
+        batch_size: int = 32,
+        inplace: bool = False,
+    ) -> List[Dict]:
         """
         Analyze sentiment in news articles.
 
+        Every non-empty field of every article is scored in one batched pass,
+        so the transformer backend runs a handful of large forward passes
+        instead of one call per field per article.
+
         Args:
-            articles: List of article dictionaries
+            articles: Article dictionaries (any iterable)
             fields: Which fields to analyze (default: ["title", "description"])
+            batch_size: Number of texts per transformer forward pass
+            inplace: Write results into the input dictionaries instead of
+                shallow copies (saves one dict copy per article)
 
         Returns:
             Articles with added sentiment analysis
@@ -159,33 +187,12 @@ class SentimentAnalyzer:
         if fields is None:
             fields = ["title", "description"]
 
+        if not isinstance(articles, list):
+            articles = list(articles)
         print(f"\nAnalyzing sentiment in {len(articles)} articles...")
         print(f"Fields to analyze: {fields}")
 
-        analyzed_articles = []
-
-        for article in tqdm(articles, desc="Analyzing articles"):
-            article_copy = article.copy()
-            article_copy["sentiment_analysis"] = {}
-
-            for field in fields:
-                text = article.get(field, "")
-                if text and text.strip():
-                    article_copy["sentiment_analysis"][field] = self.analyze_text(text)
-
-            sentiments = list(article_copy["sentiment_analysis"].values())
-            if sentiments:
-                labels = [item["label"] for item in sentiments]
-                most_common = max(set(labels), key=labels.count)
-                avg_score = sum(item["score"] for item in sentiments) / len(sentiments)
-                article_copy["sentiment_analysis"]["overall"] = {
-                    "label": most_common,
-                    "score": round(avg_score, 4)
-                }
-
-            analyzed_articles.append(article_copy)
-
-        return analyzed_articles
+        return self._analyze_article_chunk(articles, fields, batch_size, inplace)
 
     def get_sentiment_statistics(self, analyzed_articles: List[Dict]) -> Dict:
         """
@@ -209,28 +216,89 @@ class SentimentAnalyzer:
         if not sentiments:
             return {}
 
-        positive = sum(1 for item in sentiments if item["label"] == "POSITIVE")
-        negative = sum(1 for item in sentiments if item["label"] == "NEGATIVE")
-        neutral = len(sentiments) - positive - negative
-        avg_score = sum(item["score"] for item in sentiments) / len(sentiments)
-        avg_positive = sum(float(item.get("positive_percent", 0.0)) for item in sentiments) / len(sentiments)
-        avg_negative = sum(float(item.get("negative_percent", 0.0)) for item in sentiments) / len(sentiments)
-        avg_neutral = sum(float(item.get("neutral_percent", 0.0)) for item in sentiments) / len(sentiments)
+        total = len(sentiments)
+        neutral_id = self.LABEL_IDS["NEUTRAL"]
+        label_ids = np.fromiter(
+            (self.LABEL_IDS.get(item["label"], neutral_id) for item in sentiments),
+            dtype=np.int8,
+            count=total,
+        )
+        counts = np.bincount(label_ids, minlength=len(self.LABELS))
+        percents = counts / total * 100
+        signals = np.array(
+            [
+                (
+                    item["score"],
+                    float(item.get("positive_percent", 0.0)),
+                    float(item.get("negative_percent", 0.0)),
+                    float(item.get("neutral_percent", 0.0)),
+                )
+                for item in sentiments
+            ],
+            dtype=np.float64,
+        ).mean(axis=0)
+        positive, negative, neutral = (int(count) for count in counts)
+        avg_score, avg_positive, avg_negative, avg_neutral = (float(value) for value in signals)
 
         return {
-            "total_analyzed": len(sentiments),
+            "total_analyzed": total,
             "positive": positive,
             "negative": negative,
             "neutral": neutral,
-            "positive_percent": round(positive / len(sentiments) * 100, 2),
-            "negative_percent": round(negative / len(sentiments) * 100, 2),
-            "neutral_percent": round(neutral / len(sentiments) * 100, 2),
+            "positive_percent": round(float(percents[0]), 2),
+            "negative_percent": round(float(percents[1]), 2),
+            "neutral_percent": round(float(percents[2]), 2),
             "average_confidence": round(avg_score, 4),
             "average_positive_signal": round(avg_positive, 2),
             "average_negative_signal": round(avg_negative, 2),
             "average_neutral_signal": round(avg_neutral, 2),
         }
 
+    def _apply_scores(
+        self,
+        articles: List[Dict],
+        entries: List[Tuple[int, str, str]],
+        unique_scores: Dict[str, Dict],
+        inplace: bool,
+    ) -> List[Dict]:
+        """Scatter per-text scores into "sentiment_analysis" and add the overall result."""
+        analyzed_articles = []
+        for article in articles:
+            article_copy = article if inplace else article.copy()
+            article_copy["sentiment_analysis"] = {}
+            analyzed_articles.append(article_copy)
+
+        for index, field, text in entries:
+            analyzed_articles[index]["sentiment_analysis"][field] = dict(unique_scores[text])
+
+        for article_copy in analyzed_articles:
+            sentiments = list(article_copy["sentiment_analysis"].values())
+            if sentiments:
+                labels = [item["label"] for item in sentiments]
+                most_common = max(set(labels), key=labels.count)
+                avg_score = sum(item["score"] for item in sentiments) / len(sentiments)
+                article_copy["sentiment_analysis"]["overall"] = {
+                    "label": most_common,
+                    "score": avg_score
+                }
+
+        return analyzed_articles
+
+    def _analyze_uncached(self, text: str) -> Tuple[Tuple[str, Union[str, float]], ...]:
+        """Score one truncated text; wrapped in an LRU cache by __init__."""
+        if self.backend == "transformers" and self.model is not None:
+            try:
+                result = self._run_model(text)[0]
+                base_result = {
+                    "label": result["label"],
+                    "score": result["score"]
+                }
+                return tuple(self._augment_transformer_result(base_result).items())
+            except Exception as exc:
+                print(f"Error analyzing text with transformers: {exc}")
+
+        return tuple(self._analyze_text_heuristic(text).items())
+
     def _analyze_text_heuristic(self, text: str) -> Dict[str, Union[str, float]]:
         """Score text with a lexical fallback model."""
         lowered = text.lower()
@@ -261,13 +329,13 @@ class SentimentAnalyzer:
             spillover = round(max(0.0, 100.0 - (positive_percent + negative_percent + neutral_percent)), 2)
             neutral_percent = round(neutral_percent + spillover, 2)
 
-        intensity = round(min((max(total_hits, magnitude) / 4.0), 1.0), 4)
-        valence = round((positive_percent - negative_percent) / 100, 4)
+        intensity = min((max(total_hits, magnitude) / 4.0), 1.0)
+        valence = (positive_percent - negative_percent) / 100
         deep_label = self._derive_deep_label(label=label, valence=valence, intensity=intensity, neutral_percent=neutral_percent)
 
         return {
             "label": label,
-            "score": round(score, 4),
+            "score": score,
             "positive_percent": positive_percent,
             "negative_percent": negative_percent,
             "neutral_percent": neutral_percent,
@@ -276,6 +344,14 @@ class SentimentAnalyzer:
             "deep_label": deep_label,
         }
 
+    def _scores_from_label_scores(self, label_scores: List[Dict]) -> Dict[str, Union[str, float]]:
+        """Convert model label scores, highest first, into this analyzer's result."""
+        top = label_scores[0]
+        return self._augment_transformer_result({
+            "label": top["label"],
+            "score": top["score"]
+        })
+
     def _augment_transformer_result(self, base_result: Dict[str, Union[str, float]]) -> Dict[str, Union[str, float]]:
         """Derive richer sentiment structure from a transformer label/score pair."""
         label = str(base_result.get("label", "NEUTRAL")).upper()
@@ -292,8 +368,8 @@ class SentimentAnalyzer:
             negative_percent = 20.0
 
         neutral_percent = round(max(0.0, 100.0 - positive_percent - negative_percent), 2)
-        intensity = round(max(abs(positive_percent - negative_percent) / 100, score), 4)
-        valence = round((positive_percent - negative_percent) / 100, 4)
+        intensity = max(abs(positive_percent - negative_percent) / 100, score)
+        valence = (positive_percent - negative_percent) / 100
         deep_label = self._derive_deep_label(label=label, valence=valence, intensity=intensity, neutral_percent=neutral_percent)
 
         enriched = dict(base_result)
@@ -320,29 +396,16 @@ class SentimentAnalyzer:
         return "mixed_or_cautious"
 
 
-def load_articles_from_json(filepath: str) -> List[Dict]:
-    """Load articles from JSON file."""
-    with open(filepath, "r", encoding="utf-8") as handle:
-        data = json.load(handle)
-
-    if isinstance(data, dict) and "articles" in data:
-        return data["articles"]
-    if isinstance(data, list):
-        return data
-    return []
-
-
 def save_analyzed_articles(articles: List[Dict], output_path: str):
     """Save analyzed articles to JSON file."""
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_file, "w", encoding="utf-8") as handle:
-        json.dump({
+    write_articles_payload(
+        {
             "analyzed_at": str(Path(__file__).parent),
             "total_articles": len(articles),
-            "articles": articles
-        }, handle, indent=2, ensure_ascii=False)
+            "articles": articles,
+        },
+        output_path,
+    )
 
     print(f"Saved analyzed articles to: {output_path}")
 
@@ -4,19 +4,48 @@ News ingestion module for live NewsAPI retrieval.
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 import json
 import logging
 import os
 import re
+import sys
+import threading
 import time
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.utils.background_writer import get_background_writer, write_bytes_atomic
 
 logger = logging.getLogger(__name__)
 
+# Failure status of the fetch call running in the current thread or task.
+_fetch_status: ContextVar[Optional[Dict[str, str]]] = ContextVar("news_fetch_status", default=None)
+# Set while a concurrent fan-out runs; only then do requests wait for rate-limiter slots.
+_rate_limited: ContextVar[bool] = ContextVar("news_rate_limited", default=False)
+
 
 class NewsIngestor:
     """Fetch and store news articles about geopolitical topics."""
@@ -48,6 +77,11 @@ class NewsIngestor:
         "politico.com",
     ]
     DOMAIN_BATCH_SIZE = 5
+    POOL_CONNECTIONS = 8
+    POOL_MAXSIZE = 16
+    TOPIC_CONCURRENCY = 5
+    REQUESTS_PER_SECOND = 4.0
+    DOMAIN_BATCH_CONCURRENCY = 2
     GEOPOLITICAL_TERMS = {
         "geopolitics",
         "geopolitical",
@@ -83,13 +117,116 @@ class NewsIngestor:
         "china OR taiwan OR indo-pacific OR military OR foreign policy",
     ]
 
-    def __init__(self, api_key: str, data_dir: str = "data/raw/news"):
+    def __init__(self, api_key: str, data_dir: str = "data/raw/news", session: Any | None = None):
         self.api_key = api_key
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.base_url = "https://newsapi.org/v2/everything"
         self.top_headlines_url = "https://newsapi.org/v2/top-headlines"
-        self.last_failure_reason = ""
+        self._last_failure_reason = ""
+        self.topic_failure_reasons: Dict[str, str] = {}
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._owns_session = session is None
+        self.session = session or self._build_session()
+        self._async_session = None
+        self._async_session_loop = None
+
+    @property
+    def last_failure_reason(self) -> str:
+        """Why the most recent fetch came back short ("" if it did not fail)."""
+        status = _fetch_status.get()
+        return status["reason"] if status is not None else self._last_failure_reason
+
+    @last_failure_reason.setter
+    def last_failure_reason(self, reason: str) -> None:
+        status = _fetch_status.get()
+        if status is not None:
+            status["reason"] = reason
+        else:
+            self._last_failure_reason = reason
+
+    @contextmanager
+    def _failure_scope(self) -> Iterator[Dict[str, str]]:
+        """
+        Give one fetch call its own last_failure_reason.
+
+        Fetches running concurrently in threads or tasks record failures in
+        their own scope instead of overwriting each other; nested calls share
+        the outermost scope, which publishes its reason to the instance on exit.
+        """
+        status = _fetch_status.get()
+        if status is not None:
+            yield status
+            return
+
+        status = {"reason": ""}
+        token = _fetch_status.set(status)
+        try:
+            yield status
+        finally:
+            _fetch_status.reset(token)
+            self._last_failure_reason = status["reason"]
+
+    @contextmanager
+    def _rate_limit_scope(self) -> Iterator[None]:
+        """Space out every NewsAPI request made in this scope, including those of threads and tasks it starts."""
+        token = _rate_limited.set(True)
+        try:
+            yield
+        finally:
+            _rate_limited.reset(token)
+
+    def __enter__(self) -> "NewsIngestor":
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "NewsIngestor":
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        await self.aclose()
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP session if this ingestor created it.
+
+        The pooled aiohttp session is closed too when its event loop is still
+        usable; prefer `await aclose()` from async code.
+        """
+        if self._owns_session:
+            self.session.close()
+
+        session, loop = self._async_session, self._async_session_loop
+        self._async_session = self._async_session_loop = None
+        if session is None or session.closed:
+            return
+        if loop.is_running():
+            loop.create_task(session.close())
+        elif not loop.is_closed():
+            loop.run_until_complete(session.close())
+        else:
+            # The loop that owned the connections is gone, and they went with it.
+            session.detach()
+
+    async def aclose(self) -> None:
+        """Close the pooled aiohttp session used by afetch_news, if one was opened."""
+        session = self._async_session
+        self._async_session = self._async_session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _build_session(self) -> requests.Session:
+        """Create a keep-alive session so repeated NewsAPI calls reuse TCP/TLS connections."""
+        session = requests.Session()
+        # Retries stay in _request_json_with_retries, which logs each attempt and reads 429 bodies.
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def fetch_news(
         self,
@@ -107,64 +244,65 @@ class NewsIngestor:
         NewsAPI returns at most 100 items per page. This method paginates until
         max_articles is reached (or API data is exhausted), then deduplicates.
         """
-        to_date = datetime.now()
-        from_date = to_date - timedelta(days=days_back)
+        with self._failure_scope():
+            to_date = datetime.now()
+            from_date = to_date - timedelta(days=days_back)
 
-        logger.info(
-            "Fetching news | query=%s | sources=%s | days_back=%s | max_articles=%s | from=%s | to=%s",
-            query,
-            sources or "",
-            days_back,
-            max_articles,
-            from_date.date(),
-            to_date.date(),
-        )
+            logger.info(
+                "Fetching news | query=%s | sources=%s | days_back=%s | max_articles=%s | from=%s | to=%s",
+                query,
+                sources or "",
+                days_back,
+                max_articles,
+                from_date.date(),
+                to_date.date(),
+            )
 
-        max_articles = max(1, int(max_articles))
-        self.last_failure_reason = ""
+            max_articles = max(1, int(max_articles))
+            self.last_failure_reason = ""
 
-        if sources:
-            aggregated = self._fetch_single_profile(
-                query=query,
-                days_back=days_back,
-                language=language,
-                sort_by=sort_by,
-                max_articles=max_articles,
-                sources=sources,
-                domains=domains,
-            )
-        else:
-            aggregated = self._fetch_top_headlines(
-                query=query,
-                language=language,
-                max_articles=max_articles,
-            )
-            unique_articles = self._finalize_articles(aggregated, query=query, max_articles=max_articles)
-            if unique_articles:
-                logger.info(
-                    "Fetched %s unique articles from top-headlines path | query=%s",
-                    len(unique_articles),
-                    query,
+            if sources:
+                aggregated = self._fetch_single_profile(
+                    query=query,
+                    days_back=days_back,
+                    language=language,
+                    sort_by=sort_by,
+                    max_articles=max_articles,
+                    sources=sources,
+                    domains=domains,
+                )
+            else:
+                aggregated = self._fetch_top_headlines(
+                    query=query,
+                    language=language,
+                    max_articles=max_articles,
+                )
+                unique_articles = self._finalize_articles(aggregated, query=query, max_articles=max_articles)
+                if unique_articles:
+                    logger.info(
+                        "Fetched %s unique articles from top-headlines path | query=%s",
+                        len(unique_articles),
+                        query,
+                    )
+                    return unique_articles
+
+                domain_batches = self._build_domain_batches(domains)
+                query_profiles = self._build_query_profiles(query)
+                aggregated = self._fetch_across_global_profiles(
+                    root_query=query,
+                    query_profiles=query_profiles,
+                    domain_batches=domain_batches,
+                    days_back=days_back,
+                    language=language,
+                    sort_by=sort_by,
+                    max_articles=max_articles,
                 )
-                return unique_articles
-
-            domain_batches = self._build_domain_batches(domains)
-            query_profiles = self._build_query_profiles(query)
-            aggregated = self._fetch_across_global_profiles(
-                root_query=query,
-                query_profiles=query_profiles,
-                domain_batches=domain_batches,
-                days_back=days_back,
-                language=language,
-                sort_by=sort_by,
-                max_articles=max_articles,
-            )
 
-        unique_articles = self._finalize_articles(aggregated, query=query, max_articles=max_articles)
-        if not unique_articles and self.last_failure_reason:
-            logger.error("News fetch produced 0 articles | query=%s | reason=%s", query, self.last_failure_reason)
-        logger.info("Fetched %s unique articles after dedup | query=%s", len(unique_articles), query)
-        return unique_articles
+            unique_articles = self._finalize_articles(aggregated, query=query, max_articles=max_articles)
+            if not unique_articles and self.last_failure_reason:
+                logger.error("News fetch produced 0 articles | query=%s | reason=%s", query, self.last_failure_reason)
+            logger.info("Fetched %s unique articles after dedup | query=%s", len(unique_articles), query)
+            return unique_articles
 
     def clean_article(self, article: Dict) -> Dict:
         """Normalize article structure before persisting."""
@@ -180,8 +318,19 @@ class NewsIngestor:
             "url_to_image": article.get("urlToImage", ""),
         }
 
-    def save_articles(self, articles: List[Dict], filename: Optional[str] = None) -> str:
-        """Save fetched articles to JSON."""
+    def save_articles(
+        self,
+        articles: List[Dict],
+        filename: Optional[str] = None,
+        background: bool = False,
+    ) -> str:
+        """
+        Save fetched articles to JSON.
+
+        With background=True the serialized file is handed to the shared
+        background writer and the path is returned before the bytes reach
+        disk; call get_background_writer().flush() before reading it back.
+        """
         if not articles:
             logger.warning("No articles to save")
             return ""
@@ -192,20 +341,22 @@ class NewsIngestor:
 
         filepath = self.data_dir / filename
         cleaned_articles = [self.clean_article(article) for article in articles]
+        payload = {
+            "fetched_at": datetime.now().isoformat(),
+            "total_articles": len(cleaned_articles),
+            "articles": cleaned_articles,
+        }
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
 
-        with open(filepath, "w", encoding="utf-8") as handle:
-            json.dump(
-                {
-                    "fetched_at": datetime.now().isoformat(),
-                    "total_articles": len(cleaned_articles),
-                    "articles": cleaned_articles,
-                },
-                handle,
-                indent=2,
-                ensure_ascii=False,
-            )
-
-        logger.info("Saved %s articles to %s", len(cleaned_articles), filepath)
+        if background:
+            get_background_writer().submit(filepath, data)
+            logger.info("Queued %s articles for saving to %s", len(cleaned_articles), filepath)
+        else:
+            write_bytes_atomic(filepath, data)
+            logger.info("Saved %s articles to %s", len(cleaned_articles), filepath)
         return str(filepath)
 
     def fetch_multiple_topics(
@@ -214,46 +365,399 @@ class NewsIngestor:
         days_back: int = 7,
         max_per_topic: int = 50,
     ) -> Dict[str, List[Dict]]:
-        """Fetch articles for multiple topic queries."""
-        results = {}
-        for index, topic in enumerate(topics, 1):
-            logger.info("Fetching topic %s/%s | topic=%s", index, len(topics), topic)
-            results[topic] = self.fetch_news(
-                query=topic,
+        """
+        Fetch articles for multiple topic queries concurrently.
+
+        When called from inside a running event loop (e.g. a notebook), the
+        fetch runs on a helper thread with its own loop instead.
+        """
+        fetch = partial(
+            self.fetch_multiple_topics_async,
+            topics,
+            days_back=days_back,
+            max_per_topic=max_per_topic,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(fetch())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(lambda: asyncio.run(fetch())).result()
+
+    async def fetch_multiple_topics_async(
+        self,
+        topics: List[str],
+        days_back: int = 7,
+        max_per_topic: int = 50,
+        concurrency: int | None = None,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch several topics in parallel with bounded concurrency.
+
+        Each topic runs the regular fetch_news retry/pagination path in a
+        worker thread, and at most `concurrency` topics are in flight. While
+        they run, every NewsAPI request waits for a slot from the
+        per-ingestor rate limiter (REQUESTS_PER_SECOND). Each topic's failure
+        reason ("" on success) is stored in topic_failure_reasons.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.TOPIC_CONCURRENCY)
+
+        async def fetch_topic(index: int, topic: str) -> Tuple[List[Dict], str]:
+            async with semaphore:
+                logger.info("Fetching topic %s/%s | topic=%s", index, len(topics), topic)
+                return await asyncio.to_thread(
+                    self._fetch_topic,
+                    topic,
+                    days_back=days_back,
+                    max_articles=max_per_topic,
+                )
+
+        with self._rate_limit_scope():
+            outcomes = await asyncio.gather(
+                *(fetch_topic(index, topic) for index, topic in enumerate(topics, 1))
+            )
+        self.topic_failure_reasons = {topic: reason for topic, (_, reason) in zip(topics, outcomes)}
+        return {topic: articles for topic, (articles, _) in zip(topics, outcomes)}
+
+    def _fetch_topic(self, topic: str, *, days_back: int, max_articles: int) -> Tuple[List[Dict], str]:
+        """Run fetch_news for one topic and return its articles with that call's failure reason."""
+        with self._failure_scope() as status:
+            articles = self.fetch_news(query=topic, days_back=days_back, max_articles=max_articles)
+            return articles, status["reason"]
+
+    async def afetch_news(
+        self,
+        query: str = "geopolitics OR international relations OR diplomacy",
+        sources: str | None = None,
+        domains: str | None = None,
+        days_back: int = 7,
+        language: str = "en",
+        sort_by: str = "publishedAt",
+        max_articles: int = 100,
+        session: Any | None = None,
+    ) -> List[Dict]:
+        """
+        Async counterpart of fetch_news that issues independent requests concurrently.
+
+        The pages after the first are requested together, and the domain
+        batches of each query profile DOMAIN_BATCH_CONCURRENCY at a time, over
+        one aiohttp session. Without `session`, the ingestor's pooled
+        ClientSession is reused across calls on the same event loop and
+        closed by aclose()/close(). Top-headline countries are still
+        requested one by one, and both fan-outs stop early like fetch_news
+        once enough relevant articles are in, and the concurrent requests
+        share the per-ingestor rate limiter. Without aiohttp, fetch_news
+        runs in a worker thread instead.
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(
+                self.fetch_news,
+                query=query,
+                sources=sources,
+                domains=domains,
                 days_back=days_back,
-                max_articles=max_per_topic,
+                language=language,
+                sort_by=sort_by,
+                max_articles=max_articles,
+            )
+
+        if session is None:
+            session = self._pooled_async_session()
+
+        with self._failure_scope(), self._rate_limit_scope():
+            logger.info(
+                "Fetching news (async) | query=%s | sources=%s | days_back=%s | max_articles=%s",
+                query,
+                sources or "",
+                days_back,
+                max_articles,
+            )
+
+            max_articles = max(1, int(max_articles))
+            self.last_failure_reason = ""
+            profile_args = {"days_back": days_back, "language": language, "sort_by": sort_by}
+
+            if sources:
+                aggregated = await self._afetch_single_profile(
+                    session,
+                    query=query,
+                    max_articles=max_articles,
+                    sources=sources,
+                    domains=domains,
+                    **profile_args,
+                )
+            else:
+                aggregated = await self._afetch_top_headlines(
+                    session,
+                    query=query,
+                    max_articles=max_articles,
+                )
+                unique_articles = self._finalize_articles(aggregated, query=query, max_articles=max_articles)
+                if unique_articles:
+                    logger.info(
+                        "Fetched %s unique articles from top-headlines path | query=%s",
+                        len(unique_articles),
+                        query,
+                    )
+                    return unique_articles
+
+                aggregated = await self._afetch_across_global_profiles(
+                    session,
+                    root_query=query,
+                    query_profiles=self._build_query_profiles(query),
+                    domain_batches=self._build_domain_batches(domains),
+                    max_articles=max_articles,
+                    **profile_args,
+                )
+
+            unique_articles = self._finalize_articles(aggregated, query=query, max_articles=max_articles)
+            if not unique_articles and self.last_failure_reason:
+                logger.error("News fetch produced 0 articles | query=%s | reason=%s", query, self.last_failure_reason)
+            logger.info("Fetched %s unique articles after dedup | query=%s", len(unique_articles), query)
+            return unique_articles
+
+    def _pooled_async_session(self):
+        """
+        Return the ingestor's aiohttp session, creating it on first use.
+
+        A ClientSession is bound to the event loop it was created on, so a
+        call from a different loop (e.g. a second asyncio.run) gets a new one.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._async_session
+        if session is None or session.closed or self._async_session_loop is not loop:
+            if session is not None and not session.closed and self._async_session_loop.is_closed():
+                session.detach()
+            session = self._build_async_session()
+            self._async_session, self._async_session_loop = session, loop
+        return session
+
+    def _build_async_session(self):
+        """Create an aiohttp session whose connector pools up to POOL_MAXSIZE connections."""
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.POOL_MAXSIZE))
+
+    async def _afetch_top_headlines(self, session, *, query: str, max_articles: int) -> List[Dict]:
+        """Fetch top headlines country by country, stopping once enough relevant articles are in."""
+        page_size = min(max(max_articles, 20), 100)
+        query_term = self._normalize_top_headlines_query(query)
+        aggregated: List[Dict] = []
+
+        for country in self.TOP_HEADLINE_COUNTRIES:
+            payload = await self._arequest_json_with_retries(
+                session,
+                url=self.top_headlines_url,
+                params=self._top_headlines_params(country, page_size, query_term),
+                request_name="top-headlines",
+                query=query,
+                page=1,
+                context=country,
+            )
+            if self._collect_top_headlines(aggregated, payload, query=query, country=country, max_articles=max_articles):
+                break
+        return aggregated
+
+    async def _afetch_across_global_profiles(
+        self,
+        session,
+        *,
+        root_query: str,
+        query_profiles: List[str],
+        domain_batches: List[str | None],
+        days_back: int,
+        language: str,
+        sort_by: str,
+        max_articles: int,
+    ) -> List[Dict]:
+        """
+        Async counterpart of _fetch_across_global_profiles.
+
+        Domain batches are requested DOMAIN_BATCH_CONCURRENCY at a time and
+        the early stop is checked after each group, so a satisfied fetch
+        issues about as few requests as the sequential path.
+        """
+        aggregated: List[Dict] = []
+        per_profile_limit = max(10, min(20, (max_articles // max(1, len(domain_batches))) + 5))
+        width = self.DOMAIN_BATCH_CONCURRENCY
+
+        for query_profile in query_profiles:
+            for start in range(0, len(domain_batches), width):
+                batch_results = await asyncio.gather(
+                    *(
+                        self._afetch_single_profile(
+                            session,
+                            query=query_profile,
+                            days_back=days_back,
+                            language=language,
+                            sort_by=sort_by,
+                            max_articles=per_profile_limit,
+                            domains=domain_batch,
+                        )
+                        for domain_batch in domain_batches[start:start + width]
+                    )
+                )
+                for batch_articles in batch_results:
+                    aggregated.extend(batch_articles)
+                if self._has_enough_relevant(aggregated, root_query=root_query, max_articles=max_articles):
+                    return aggregated
+
+        return aggregated
+
+    async def _afetch_single_profile(
+        self,
+        session,
+        *,
+        query: str,
+        days_back: int,
+        language: str,
+        sort_by: str,
+        max_articles: int,
+        sources: str | None = None,
+        domains: str | None = None,
+    ) -> List[Dict]:
+        """Fetch page 1 of a profile, then every remaining page it reports concurrently."""
+        to_date = datetime.now()
+        from_date = to_date - timedelta(days=days_back)
+        page_size = min(max_articles, 100)
+
+        async def fetch_page(page: int) -> Optional[Dict]:
+            params = self._everything_params(
+                query=query,
+                from_date=from_date,
+                to_date=to_date,
+                language=language,
+                sort_by=sort_by,
+                page_size=page_size,
+                page=page,
+                sources=sources,
+                domains=domains,
+            )
+            return await self._arequest_json_with_retries(
+                session,
+                url=self.base_url,
+                params=params,
+                request_name="everything",
+                query=query,
+                page=page,
+            )
+
+        first_payload = await fetch_page(1)
+        aggregated = self._everything_page_articles(first_payload, query=query, page=1)
+        if not aggregated:
+            return []
+
+        total_results = int(first_payload.get("totalResults", 0))
+        wanted = min(max_articles, total_results) if total_results > 0 else max_articles
+        pages = range(2, -(-wanted // page_size) + 1)
+        for page, payload in zip(pages, await asyncio.gather(*(fetch_page(page) for page in pages))):
+            page_articles = self._everything_page_articles(payload, query=query, page=page)
+            if not page_articles:
+                break
+            aggregated.extend(page_articles)
+
+        return aggregated[:max_articles]
+
+    def _everything_page_articles(self, payload: Optional[Dict], *, query: str, page: int) -> List[Dict]:
+        """Return a page's articles, logging failed or non-ok pages and returning [] for them."""
+        if payload is None:
+            logger.error("News page fetch failed after retries | query=%s | page=%s", query, page)
+            return []
+        if payload.get("status") != "ok":
+            self.last_failure_reason = payload.get("message", "NewsAPI everything returned non-ok status")
+            logger.error(
+                "NewsAPI logical error | query=%s | page=%s | message=%s",
+                query,
+                page,
+                self.last_failure_reason,
             )
-            if index < len(topics):
-                time.sleep(2)
-        return results
+            return []
+        page_articles = payload.get("articles", [])
+        logger.info(
+            "News page received | query=%s | page=%s | page_articles=%s | total_results=%s",
+            query,
+            page,
+            len(page_articles),
+            payload.get("totalResults", 0),
+        )
+        return page_articles
+
+    async def _arequest_json_with_retries(
+        self,
+        session,
+        *,
+        url: str,
+        params: Dict,
+        request_name: str,
+        query: str,
+        page: int,
+        context: str = "",
+    ) -> Optional[Dict]:
+        """aiohttp version of _request_json_with_retries, with the same retry and logging policy."""
+        request_info = (request_name, query, context, page)
+        backoff = self.BASE_BACKOFF_SECONDS
+        timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT_SECONDS)
+
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            delay = self._reserve_request_slot()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                async with session.get(url, params=params, timeout=timeout) as response:
+                    status_code = response.status
+                    body = await response.read()
+                self._log_response(request_info, attempt, status_code)
+                if status_code < 400:
+                    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+                try:
+                    api_message = self._api_message_from_payload(json.loads(body))
+                except ValueError:
+                    api_message = ""
+                if not self._record_http_error(request_info, attempt, status_code, api_message):
+                    return None
+            except asyncio.TimeoutError as exc:
+                self._record_request_failure(request_info, attempt, "timeout", exc)
+            except aiohttp.ClientConnectionError as exc:
+                self._record_request_failure(request_info, attempt, "connection error", exc)
+            except (aiohttp.ClientError, ValueError) as exc:
+                self._record_request_failure(request_info, attempt, "request exception", exc)
+
+            if attempt < self.MAX_RETRIES:
+                self._log_retry(request_info, attempt, backoff)
+                await asyncio.sleep(backoff)
+                backoff *= 2
+
+        return None
 
     def get_statistics(self, articles: List[Dict]) -> Dict:
         """Generate basic statistics for a fetched article set."""
         if not articles:
             return {"total": 0}
 
-        sources: Dict[str, int] = {}
+        sources: Counter = Counter()
+        earliest = latest = ""
         for article in articles:
             source_value = article.get("source", "Unknown")
             if isinstance(source_value, dict):
                 source = source_value.get("name", "Unknown")
             else:
                 source = source_value or "Unknown"
-            sources[source] = sources.get(source, 0) + 1
+            sources[source] += 1
 
-        published_values = []
-        for article in articles:
             published = article.get("publishedAt") or article.get("published_at")
             if published:
-                published_values.append(published)
+                if not earliest or published < earliest:
+                    earliest = published
+                if published > latest:
+                    latest = published
 
         return {
             "total": len(articles),
             "sources": len(sources),
-            "top_sources": dict(sorted(sources.items(), key=lambda item: item[1], reverse=True)[:5]),
+            "top_sources": dict(sources.most_common(5)),
             "date_range": {
-                "earliest": min(published_values) if published_values else "",
-                "latest": max(published_values) if published_values else "",
+                "earliest": earliest,
+                "latest": latest,
             },
         }
 
@@ -331,18 +835,23 @@ class NewsIngestor:
                     domains=domain_batch,
                 )
                 aggregated.extend(batch_articles)
-
-                current_candidates = self._filter_relevant_articles(self._dedupe_articles(aggregated), query=root_query)
-                if len(current_candidates) >= max_articles:
-                    logger.info(
-                        "Early stop for global profile fetch | query=%s | accumulated_relevant_articles=%s",
-                        root_query,
-                        len(current_candidates),
-                    )
+                if self._has_enough_relevant(aggregated, root_query=root_query, max_articles=max_articles):
                     return aggregated
 
         return aggregated
 
+    def _has_enough_relevant(self, aggregated: List[Dict], *, root_query: str, max_articles: int) -> bool:
+        """Early-stop check for the global profile fan-out."""
+        current_candidates = self._filter_relevant_articles(self._dedupe_articles(aggregated), query=root_query)
+        if len(current_candidates) < max_articles:
+            return False
+        logger.info(
+            "Early stop for global profile fetch | query=%s | accumulated_relevant_articles=%s",
+            root_query,
+            len(current_candidates),
+        )
+        return True
+
     def _fetch_top_headlines(
         self,
         *,
@@ -363,54 +872,69 @@ class NewsIngestor:
         )
 
         for country in self.TOP_HEADLINE_COUNTRIES:
-            params = {
-                "country": country,
-                "pageSize": page_size,
-                "page": 1,
-                "apiKey": self.api_key,
-            }
-            if query_term:
-                params["q"] = query_term
-
             payload = self._request_json_with_retries(
                 url=self.top_headlines_url,
-                params=params,
+                params=self._top_headlines_params(country, page_size, query_term),
                 request_name="top-headlines",
                 query=query,
                 page=1,
                 context=country,
             )
-            if payload is None:
-                continue
+            if self._collect_top_headlines(aggregated, payload, query=query, country=country, max_articles=max_articles):
+                break
 
-            if payload.get("status") != "ok":
-                self.last_failure_reason = payload.get("message", "NewsAPI top-headlines returned non-ok status")
-                logger.error(
-                    "Top-headlines logical error | query=%s | country=%s | message=%s",
-                    query,
-                    country,
-                    self.last_failure_reason,
-                )
-                continue
+        return aggregated
 
-            page_articles = payload.get("articles", [])
-            if not page_articles:
-                logger.warning("Top-headlines returned 0 articles | query=%s | country=%s", query, country)
-                continue
+    def _top_headlines_params(self, country: str, page_size: int, query_term: str) -> Dict:
+        """Build the query string for one /v2/top-headlines request."""
+        params = {
+            "country": country,
+            "pageSize": page_size,
+            "page": 1,
+            "apiKey": self.api_key,
+        }
+        if query_term:
+            params["q"] = query_term
+        return params
 
-            aggregated.extend(page_articles)
-            current_candidates = self._finalize_articles(aggregated, query=query, max_articles=max_articles)
-            logger.info(
-                "Top-headlines received | query=%s | country=%s | page_articles=%s | relevant_accumulated=%s",
+    def _collect_top_headlines(
+        self,
+        aggregated: List[Dict],
+        payload: Optional[Dict],
+        *,
+        query: str,
+        country: str,
+        max_articles: int,
+    ) -> bool:
+        """Add one country's top headlines to `aggregated`; return True once enough relevant articles are in."""
+        if payload is None:
+            return False
+
+        if payload.get("status") != "ok":
+            self.last_failure_reason = payload.get("message", "NewsAPI top-headlines returned non-ok status")
+            logger.error(
+                "Top-headlines logical error | query=%s | country=%s | message=%s",
                 query,
                 country,
-                len(page_articles),
-                len(current_candidates),
+                self.last_failure_reason,
             )
-            if len(current_candidates) >= max_articles:
-                break
+            return False
 
-        return aggregated
+        page_articles = payload.get("articles", [])
+        if not page_articles:
+            logger.warning("Top-headlines returned 0 articles | query=%s | country=%s", query, country)
+            return False
+
+        aggregated.extend(page_articles)
+        current_candidates = self._finalize_articles(aggregated, query=query, max_articles=max_articles)
+        logger.info(
+            "Top-headlines received | query=%s | country=%s | page_articles=%s | relevant_accumulated=%s",
+            query,
+            country,
+            len(page_articles),
+            len(current_candidates),
+        )
+        return len(current_candidates) >= max_articles
 
     def _fetch_single_profile(
         self,
@@ -439,20 +963,17 @@ class NewsIngestor:
         )
 
         while len(aggregated) < max_articles:
-            params = {
-                "q": query,
-                "from": from_date.strftime("%Y-%m-%d"),
-                "to": to_date.strftime("%Y-%m-%d"),
-                "language": language,
-                "sortBy": sort_by,
-                "pageSize": page_size,
-                "page": page,
-                "apiKey": self.api_key,
-            }
-            if sources:
-                params["sources"] = sources
-            if domains:
-                params["domains"] = domains
+            params = self._everything_params(
+                query=query,
+                from_date=from_date,
+                to_date=to_date,
+                language=language,
+                sort_by=sort_by,
+                page_size=page_size,
+                page=page,
+                sources=sources,
+                domains=domains,
+            )
 
             try:
                 payload = self._fetch_page_with_retries(params=params, query=query, page=page)
@@ -499,6 +1020,36 @@ class NewsIngestor:
 
         return aggregated[:max_articles]
 
+    def _everything_params(
+        self,
+        *,
+        query: str,
+        from_date: datetime,
+        to_date: datetime,
+        language: str,
+        sort_by: str,
+        page_size: int,
+        page: int,
+        sources: str | None = None,
+        domains: str | None = None,
+    ) -> Dict:
+        """Build the query string for one /v2/everything page."""
+        params = {
+            "q": query,
+            "from": from_date.strftime("%Y-%m-%d"),
+            "to": to_date.strftime("%Y-%m-%d"),
+            "language": language,
+            "sortBy": sort_by,
+            "pageSize": page_size,
+            "page": page,
+            "apiKey": self.api_key,
+        }
+        if sources:
+            params["sources"] = sources
+        if domains:
+            params["domains"] = domains
+        return params
+
     def _filter_relevant_articles(self, articles: List[Dict], query: str) -> List[Dict]:
         """Drop obvious non-geopolitical matches from broad NewsAPI queries."""
         if not articles:
@@ -557,109 +1108,127 @@ class NewsIngestor:
         context: str = "",
     ) -> Optional[Dict]:
         """Fetch one NewsAPI JSON payload with retries and exponential backoff."""
+        request_info = (request_name, query, context, page)
         backoff = self.BASE_BACKOFF_SECONDS
 
         for attempt in range(1, self.MAX_RETRIES + 1):
+            delay = self._reserve_request_slot()
+            if delay > 0:
+                time.sleep(delay)
             try:
-                response = requests.get(url, params=params, timeout=self.REQUEST_TIMEOUT_SECONDS)
-                logger.info(
-                    "NewsAPI response | request=%s | query=%s | context=%s | page=%s | attempt=%s | status_code=%s",
-                    request_name,
-                    query,
-                    context,
-                    page,
-                    attempt,
-                    response.status_code,
-                )
+                response = self.session.get(url, params=params, timeout=self.REQUEST_TIMEOUT_SECONDS)
+                self._log_response(request_info, attempt, response.status_code)
                 response.raise_for_status()
                 return response.json()
             except requests.exceptions.Timeout as exc:
-                self.last_failure_reason = f"{request_name} timeout"
-                logger.warning(
-                    "NewsAPI timeout | request=%s | query=%s | context=%s | page=%s | attempt=%s/%s | error=%s",
-                    request_name,
-                    query,
-                    context,
-                    page,
-                    attempt,
-                    self.MAX_RETRIES,
-                    self._sanitize_error_message(exc),
-                )
+                self._record_request_failure(request_info, attempt, "timeout", exc)
             except requests.exceptions.ConnectionError as exc:
-                self.last_failure_reason = f"{request_name} connection error"
-                logger.warning(
-                    "NewsAPI connection error | request=%s | query=%s | context=%s | page=%s | attempt=%s/%s | error=%s",
-                    request_name,
-                    query,
-                    context,
-                    page,
-                    attempt,
-                    self.MAX_RETRIES,
-                    self._sanitize_error_message(exc),
-                )
+                self._record_request_failure(request_info, attempt, "connection error", exc)
             except requests.exceptions.HTTPError as exc:
                 status_code = exc.response.status_code if exc.response is not None else None
-                api_message = self._extract_api_message(exc.response)
-                if status_code:
-                    self.last_failure_reason = (
-                        f"{request_name} HTTP {status_code}: {api_message}"
-                        if api_message
-                        else f"{request_name} HTTP {status_code}"
-                    )
-                else:
-                    self.last_failure_reason = f"{request_name} HTTP error"
-                if status_code and status_code >= 500:
-                    logger.warning(
-                        "NewsAPI HTTP server error | request=%s | query=%s | context=%s | page=%s | attempt=%s/%s | status_code=%s | message=%s",
-                        request_name,
-                        query,
-                        context,
-                        page,
-                        attempt,
-                        self.MAX_RETRIES,
-                        status_code,
-                        api_message or "",
-                    )
-                else:
-                    logger.error(
-                        "NewsAPI HTTP client error | request=%s | query=%s | context=%s | page=%s | attempt=%s | status_code=%s | message=%s",
-                        request_name,
-                        query,
-                        context,
-                        page,
-                        attempt,
-                        status_code,
-                        api_message or "",
-                    )
+                if not self._record_http_error(request_info, attempt, status_code, self._extract_api_message(exc.response)):
                     return None
             except requests.exceptions.RequestException as exc:
-                self.last_failure_reason = f"{request_name} request exception"
-                logger.error(
-                    "NewsAPI request exception | request=%s | query=%s | context=%s | page=%s | attempt=%s/%s | error=%s",
-                    request_name,
-                    query,
-                    context,
-                    page,
-                    attempt,
-                    self.MAX_RETRIES,
-                    self._sanitize_error_message(exc),
-                )
+                self._record_request_failure(request_info, attempt, "request exception", exc)
 
             if attempt < self.MAX_RETRIES:
-                logger.warning(
-                    "Retrying NewsAPI request | request=%s | query=%s | context=%s | page=%s | next_attempt=%s | backoff=%.1fs",
-                    request_name,
-                    query,
-                    context,
-                    page,
-                    attempt + 1,
-                    backoff,
-                )
+                self._log_retry(request_info, attempt, backoff)
                 time.sleep(backoff)
                 backoff *= 2
 
         return None
 
+    def _reserve_request_slot(self) -> float:
+        """
+        Claim the next NewsAPI request slot and return how long to wait for it.
+
+        Inside a fan-out (fetch_multiple_topics_async, afetch_news) slots are
+        spaced 1 / REQUESTS_PER_SECOND apart across every thread and task
+        using this ingestor, so concurrent requests stay within the limit.
+        A plain sequential fetch_news call is never delayed.
+        """
+        if not _rate_limited.get():
+            return 0.0
+        interval = 1.0 / self.REQUESTS_PER_SECOND
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + interval
+        return start - now
+
+    def _log_response(self, request_info: Tuple[str, str, str, int], attempt: int, status_code: int) -> None:
+        logger.info(
+            "NewsAPI response | request=%s | query=%s | context=%s | page=%s | attempt=%s | status_code=%s",
+            *request_info,
+            attempt,
+            status_code,
+        )
+
+    def _record_http_error(
+        self,
+        request_info: Tuple[str, str, str, int],
+        attempt: int,
+        status_code: int | None,
+        api_message: str,
+    ) -> bool:
+        """Record and log an HTTP error status; return True if it is a server error worth retrying."""
+        request_name = request_info[0]
+        if status_code:
+            self.last_failure_reason = (
+                f"{request_name} HTTP {status_code}: {api_message}"
+                if api_message
+                else f"{request_name} HTTP {status_code}"
+            )
+        else:
+            self.last_failure_reason = f"{request_name} HTTP error"
+
+        if status_code and status_code >= 500:
+            logger.warning(
+                "NewsAPI HTTP server error | request=%s | query=%s | context=%s | page=%s | attempt=%s/%s | status_code=%s | message=%s",
+                *request_info,
+                attempt,
+                self.MAX_RETRIES,
+                status_code,
+                api_message,
+            )
+            return True
+
+        logger.error(
+            "NewsAPI HTTP client error | request=%s | query=%s | context=%s | page=%s | attempt=%s | status_code=%s | message=%s",
+            *request_info,
+            attempt,
+            status_code,
+            api_message,
+        )
+        return False
+
+    def _record_request_failure(
+        self,
+        request_info: Tuple[str, str, str, int],
+        attempt: int,
+        failure: str,
+        error: Exception,
+    ) -> None:
+        """Record and log a transport failure ("timeout", "connection error" or "request exception")."""
+        self.last_failure_reason = f"{request_info[0]} {failure}"
+        logger.log(
+            logging.ERROR if failure == "request exception" else logging.WARNING,
+            "NewsAPI %s | request=%s | query=%s | context=%s | page=%s | attempt=%s/%s | error=%s",
+            failure,
+            *request_info,
+            attempt,
+            self.MAX_RETRIES,
+            self._sanitize_error_message(error),
+        )
+
+    def _log_retry(self, request_info: Tuple[str, str, str, int], attempt: int, backoff: float) -> None:
+        logger.warning(
+            "Retrying NewsAPI request | request=%s | query=%s | context=%s | page=%s | next_attempt=%s | backoff=%.1fs",
+            *request_info,
+            attempt + 1,
+            backoff,
+        )
+
     def _normalize_top_headlines_query(self, query: str) -> str:
         """Map broad live-monitor queries to concrete top-headline keywords."""
         lowered = (query or "").strip().lower()
@@ -692,6 +1261,10 @@ class NewsIngestor:
         except ValueError:
             return ""
 
+        return self._api_message_from_payload(payload)
+
+    def _api_message_from_payload(self, payload: Any) -> str:
+        """Pull the sanitized "message" field out of a decoded NewsAPI error body."""
         if not isinstance(payload, dict):
             return ""
 
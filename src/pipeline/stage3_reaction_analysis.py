@@ -14,6 +14,7 @@ if __package__ in {None, ""}:
 from src.analysis.emotion import EmotionAnalyzer
 from src.analysis.engagement_metrics import EngagementMetricsAnalyzer
 from src.analysis.polarization import PolarizationAnalyzer
+from src.analysis.rounding import round_floats
 from src.analysis.sentiment import SentimentAnalyzer
 from src.utils.api_clients import load_model_config, load_pipeline_config
 
@@ -80,17 +81,16 @@ def run_stage(*, stage1_result: Dict | None = None, stage2_result: Dict | None =
     news_sentiment = sentiment_analyzer.analyze_articles(articles, fields=["title", "description"])
     news_emotions = emotion_analyzer.analyze_articles(articles, fields=["title", "description"])
 
-    merged_articles = []
+    # news_sentiment already holds fresh per-article copies; merge emotions into them in place.
     for sent_item, emo_item in zip(news_sentiment, news_emotions):
-        merged = dict(sent_item)
-        merged["emotion_analysis"] = emo_item.get("emotion_analysis", {})
-        merged_articles.append(merged)
+        sent_item["emotion_analysis"] = emo_item.get("emotion_analysis", {})
+    merged_articles = news_sentiment
 
     news_payload = {
         "total_articles": len(merged_articles),
         "sentiment_statistics": sentiment_analyzer.get_sentiment_statistics(news_sentiment),
         "emotion_statistics": emotion_analyzer.get_emotion_statistics(news_emotions),
-        "articles": merged_articles,
+        "articles": round_floats(merged_articles),
     }
 
     texts = [comment.get("text", "") for comment in comments]
@@ -0,0 +1,557 @@
+"""Tests for the batched sentiment and emotion analyzer paths."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.analysis.article_texts import prepare_texts
+from src.analysis import combined_analyzer
+from src.analysis.combined_analyzer import CombinedAnalyzer, CombinedBatch
+from src.analysis import model_runtime, multi_analysis
+from src.analysis.emotion import EmotionAnalyzer
+from src.analysis.multi_analysis import (
+    _analyze_shared_tokens,
+    _prefetch,
+    analyze_articles_multi,
+    analyze_articles_parallel,
+)
+from src.analysis.rounding import round_floats
+from src.analysis.sentiment import (
+    SentimentAnalyzer,
+    load_articles_from_json,
+    save_analyzed_articles,
+    save_analyzed_articles_ndjson,
+)
+from src.utils.inference_cache import InferenceCache
+import src.tests.test_analysis as analysis_script
+
+
+SAMPLE_ARTICLES = [
+    {"title": "Ceasefire talks bring hope", "description": "Diplomats report progress."},
+    {"title": "Missile strike deepens crisis", "description": ""},
+    {"title": "", "description": "A short note."},
+]
+
+
+class FakeSentimentPipeline:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, **_kwargs):
+        texts = list(texts)
+        self.calls.append(texts)
+        return [
+            {"label": "POSITIVE" if "hope" in text or "progress" in text else "NEGATIVE", "score": 0.9}
+            for text in texts
+        ]
+
+
+class FakeEmotionPipeline:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, **_kwargs):
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        self.calls.append(texts)
+        return [
+            [{"label": "fear", "score": 0.7}, {"label": "joy", "score": 0.3}]
+            if "crisis" in text
+            else [{"label": "joy", "score": 0.8}, {"label": "fear", "score": 0.2}]
+            for text in texts
+        ]
+
+
+def _transformer_analyzer(analyzer_cls, fake_model):
+    analyzer = analyzer_cls(prefer_transformers=False)
+    analyzer.backend = "transformers"
+    analyzer.model = fake_model
+    return analyzer
+
+
+def test_sentiment_analyze_articles_batches_all_fields_in_one_call():
+    fake_model = FakeSentimentPipeline()
+    analyzer = _transformer_analyzer(SentimentAnalyzer, fake_model)
+
+    analyzed = analyzer.analyze_articles(SAMPLE_ARTICLES, fields=["title", "description"])
+
+    assert len(fake_model.calls) == 1
+    assert [len(text) for text in fake_model.calls[0]] == sorted(len(text) for text in fake_model.calls[0])
+    assert len(fake_model.calls[0]) == 4
+    assert analyzed[0]["sentiment_analysis"]["title"]["label"] == "POSITIVE"
+    assert analyzed[1]["sentiment_analysis"]["title"]["label"] == "NEGATIVE"
+    assert "description" not in analyzed[1]["sentiment_analysis"]
+    assert "title" not in analyzed[2]["sentiment_analysis"]
+    assert "deep_label" in analyzed[0]["sentiment_analysis"]["title"]
+
+
+def test_emotion_analyze_articles_scatters_batched_results_back_in_order():
+    fake_model = FakeEmotionPipeline()
+    analyzer = _transformer_analyzer(EmotionAnalyzer, fake_model)
+
+    analyzed = analyzer.analyze_articles(SAMPLE_ARTICLES, fields=["title", "description"])
+
+    assert len(fake_model.calls) == 1
+    assert analyzed[0]["emotion_analysis"]["overall"]["dominant_emotion"] == "joy"
+    assert analyzed[1]["emotion_analysis"]["overall"]["dominant_emotion"] == "fear"
+    assert analyzed[2]["emotion_analysis"]["description"]["joy"] == 0.8
+
+
+def test_prepare_texts_skips_blank_fields_and_truncates():
+    articles = list(SAMPLE_ARTICLES) + [{"title": "   ", "description": "x" * 600}]
+
+    entries = prepare_texts(articles, ["title", "description"])
+
+    assert [(index, field) for index, field, _ in entries] == [
+        (0, "title"), (0, "description"), (1, "title"), (2, "description"), (3, "description"),
+    ]
+    assert len(entries[-1][2]) == 512
+
+
+def test_analyze_articles_multi_matches_separate_analyzer_runs():
+    sentiment = SentimentAnalyzer(prefer_transformers=False)
+    emotion = EmotionAnalyzer(prefer_transformers=False)
+
+    combined = analyze_articles_multi(SAMPLE_ARTICLES, [sentiment, emotion])
+    separate = emotion.analyze_articles(sentiment.analyze_articles(SAMPLE_ARTICLES))
+
+    assert combined == separate
+    assert "sentiment_analysis" not in SAMPLE_ARTICLES[0]
+
+
+def test_analyze_articles_multi_runs_separate_transformer_models_concurrently():
+    sentiment_model, emotion_model = FakeSentimentPipeline(), FakeEmotionPipeline()
+    sentiment = _transformer_analyzer(SentimentAnalyzer, sentiment_model)
+    emotion = _transformer_analyzer(EmotionAnalyzer, emotion_model)
+
+    combined = analyze_articles_multi(SAMPLE_ARTICLES, [sentiment, emotion])
+
+    assert len(sentiment_model.calls) == 1 and len(emotion_model.calls) == 1
+    assert combined[1]["sentiment_analysis"]["title"]["label"] == "NEGATIVE"
+    assert combined[1]["emotion_analysis"]["overall"]["dominant_emotion"] == "fear"
+
+
+
+def test_concurrent_tokenizer_groups_split_the_torch_thread_budget(monkeypatch):
+    threads = {"count": 8}
+    fake_torch = SimpleNamespace(
+        get_num_threads=lambda: threads["count"],
+        set_num_threads=lambda count: threads.update(count=count),
+    )
+    monkeypatch.setattr(multi_analysis, "torch", fake_torch)
+    seen = []
+
+    class RecordingPipeline(FakeSentimentPipeline):
+        def __call__(self, texts, **kwargs):
+            seen.append(threads["count"])
+            return super().__call__(texts, **kwargs)
+
+    first = _transformer_analyzer(SentimentAnalyzer, RecordingPipeline())
+    second = _transformer_analyzer(SentimentAnalyzer, RecordingPipeline())
+
+    analyze_articles_multi(SAMPLE_ARTICLES, [first, second])
+
+    assert seen == [4, 4]
+    assert threads["count"] == 8
+
+class FakeTokenizer:
+    model_max_length = 512
+
+    def __init__(self, vocab):
+        self.vocab = vocab
+
+    def get_vocab(self):
+        return dict(self.vocab)
+
+
+def test_default_sentiment_and_small_emotion_models_form_one_tokenizer_group(monkeypatch):
+    monkeypatch.setattr(multi_analysis, "torch", SimpleNamespace())
+    distilbert_uncased = {"[PAD]": 0, "[UNK]": 1, "[CLS]": 101, "[SEP]": 102, "hope": 3246}
+    sentiment = _transformer_analyzer(
+        SentimentAnalyzer, SimpleNamespace(model=object(), tokenizer=FakeTokenizer(distilbert_uncased))
+    )
+    emotion = _transformer_analyzer(
+        EmotionAnalyzer, SimpleNamespace(model=object(), tokenizer=FakeTokenizer(distilbert_uncased))
+    )
+    roberta_emotion = _transformer_analyzer(
+        EmotionAnalyzer, SimpleNamespace(model=object(), tokenizer=FakeTokenizer({"<s>": 0, "</s>": 2}))
+    )
+
+    assert multi_analysis._group_by_tokenizer([sentiment, emotion]) == [[sentiment, emotion]]
+    assert multi_analysis._group_by_tokenizer([sentiment, roberta_emotion]) == [[sentiment], [roberta_emotion]]
+
+
+def test_combined_analyzer_keeps_separate_models_when_encoders_differ():
+    sentiment = SentimentAnalyzer(prefer_transformers=False)
+    emotion = EmotionAnalyzer(prefer_transformers=False)
+
+    combined = CombinedAnalyzer(sentiment, emotion)
+
+    assert combined.shared_backbone is False
+    assert combined.analyze_articles(SAMPLE_ARTICLES) == analyze_articles_multi(SAMPLE_ARTICLES, [sentiment, emotion])
+
+
+@pytest.mark.parametrize("runtime", ["onnx", "onnx-int8", "torch"])
+def test_combined_analyzer_never_shares_backbone_of_non_torch_models(monkeypatch, runtime):
+    tokenizer = object()
+    monkeypatch.setattr(combined_analyzer, "_shared_tokenizer", lambda analyzer: tokenizer)
+    ort_model = SimpleNamespace(config=SimpleNamespace(model_type="distilbert"))
+    sentiment = _transformer_analyzer(SentimentAnalyzer, SimpleNamespace(model=ort_model, tokenizer=tokenizer))
+    emotion = _transformer_analyzer(EmotionAnalyzer, SimpleNamespace(model=ort_model, tokenizer=tokenizer))
+    sentiment.runtime = emotion.runtime = runtime
+
+    assert CombinedAnalyzer(sentiment, emotion).shared_backbone is False
+
+
+def test_combined_batch_columns_align_with_articles():
+    analyzed = CombinedAnalyzer(
+        SentimentAnalyzer(prefer_transformers=False),
+        EmotionAnalyzer(prefer_transformers=False),
+    ).analyze_articles(SAMPLE_ARTICLES + [{"title": "", "description": ""}])
+
+    batch = CombinedBatch.from_articles(analyzed)
+
+    assert len(batch) == 4
+    assert batch.articles is analyzed
+    assert batch.titles[0] == SAMPLE_ARTICLES[0]["title"]
+    assert batch.sentiment_labels[0] == analyzed[0]["sentiment_analysis"]["overall"]["label"]
+    assert batch.emotion_labels[1] == analyzed[1]["emotion_analysis"]["overall"]["dominant_emotion"]
+    assert batch.sentiment_labels[3] == "" and batch.emotion_labels[3] == ""
+    top = batch.top_emotions(0)
+    overall = analyzed[0]["emotion_analysis"]["overall"]
+    assert top[0] == (overall["dominant_emotion"], overall["dominant_score"])
+    assert [score for _, score in top] == sorted((score for _, score in top), reverse=True)
+    assert batch.top_emotions(3) == []
+
+
+def test_prefetch_preserves_order_and_reraises_producer_errors():
+    def batches():
+        yield from range(5)
+        raise ValueError("tokenizer failed")
+
+    seen = []
+    with pytest.raises(ValueError, match="tokenizer failed"):
+        for item in _prefetch(batches()):
+            seen.append(item)
+
+    assert seen == [0, 1, 2, 3, 4]
+
+
+def test_prefetch_stops_producer_when_consumer_quits_early():
+    producer_closed = threading.Event()
+
+    def batches():
+        try:
+            while True:
+                yield "batch"
+        finally:
+            producer_closed.set()
+
+    prefetched = _prefetch(batches(), depth=1)
+    assert next(prefetched) == "batch"
+    prefetched.close()
+
+    assert producer_closed.wait(timeout=2)
+
+
+def test_analyze_articles_parallel_matches_serial_order():
+    articles = SAMPLE_ARTICLES * 3
+
+    parallel = analyze_articles_parallel(
+        articles,
+        analyzer_cls=EmotionAnalyzer,
+        analyzer_kwargs={"prefer_transformers": False},
+        n_workers=2,
+    )
+
+    assert parallel == EmotionAnalyzer(prefer_transformers=False).analyze_articles(articles)
+
+
+def test_load_text_classifier_reuses_loaded_pipeline(monkeypatch):
+    loads = []
+    monkeypatch.setattr(model_runtime, "_MODELS", {})
+    monkeypatch.setattr(
+        model_runtime,
+        "_build_text_classifier",
+        lambda task, model_name, **kwargs: loads.append(model_name) or (FakeEmotionPipeline(), "torch"),
+    )
+
+    first = model_runtime.load_text_classifier("text-classification", "fake-emotion", top_k=None)
+    second = model_runtime.load_text_classifier("text-classification", "fake-emotion", top_k=None)
+    other = model_runtime.load_text_classifier("text-classification", "fake-emotion")
+
+    assert first is second
+    assert other is not first
+    assert loads == ["fake-emotion", "fake-emotion"]
+
+
+def test_pipeline_device_defaults_to_first_gpu_when_cuda_is_available(monkeypatch):
+    cuda = SimpleNamespace(is_available=lambda: True)
+    monkeypatch.setattr(model_runtime, "torch", SimpleNamespace(cuda=cuda))
+    monkeypatch.delenv("GNS_CUDA_DEVICE", raising=False)
+    assert model_runtime._pipeline_device() == 0
+
+    monkeypatch.setenv("GNS_CUDA_DEVICE", "-1")
+    assert model_runtime._pipeline_device() == -1
+
+    cuda.is_available = lambda: False
+    monkeypatch.setenv("GNS_CUDA_DEVICE", "1")
+    assert model_runtime._pipeline_device() == -1
+
+
+def test_gpu_runtime_takes_precedence_over_quantize_flag(monkeypatch, capsys):
+    cuda = SimpleNamespace(is_available=lambda: True, is_bf16_supported=lambda: True)
+    fake_torch = SimpleNamespace(
+        cuda=cuda,
+        bfloat16="bfloat16",
+        float16="float16",
+        set_num_threads=lambda _threads: None,
+        set_num_interop_threads=lambda _threads: None,
+    )
+    monkeypatch.setattr(model_runtime, "torch", fake_torch)
+    monkeypatch.setattr(model_runtime, "pipeline", lambda task, **kwargs: SimpleNamespace(model=None, kwargs=kwargs))
+    monkeypatch.setattr(model_runtime, "_quantize_dynamic_int8", lambda _classifier: pytest.fail("quantized on GPU"))
+    monkeypatch.setenv("DISABLE_SAFETENSORS_CONVERSION", "1")
+    monkeypatch.setenv("GNS_QUANTIZE", "1")
+    monkeypatch.delenv("GNS_CUDA_DEVICE", raising=False)
+    monkeypatch.delenv("GNS_TRANSFORMER_RUNTIME", raising=False)
+
+    classifier, runtime = model_runtime._build_text_classifier("sentiment-analysis", "fake-sst2")
+
+    assert runtime == "cuda-bf16"
+    assert classifier.kwargs["device"] == 0
+    assert "GNS_QUANTIZE=1 ignored" in capsys.readouterr().out
+
+
+def test_heuristic_analyze_articles_matches_analyze_text():
+    analyzer = EmotionAnalyzer(prefer_transformers=False)
+
+    analyzed = analyzer.analyze_articles(SAMPLE_ARTICLES, fields=["title"])
+
+    assert round_floats(analyzed[1]["emotion_analysis"]["title"]) == analyzer.analyze_text(SAMPLE_ARTICLES[1]["title"])
+
+
+def test_inference_cache_skips_model_for_texts_scored_on_a_previous_run(tmp_path):
+    cache = InferenceCache(str(tmp_path / "analysis.db"))
+    first_model, second_model = FakeSentimentPipeline(), FakeSentimentPipeline()
+    first = _transformer_analyzer(SentimentAnalyzer, first_model)
+    second = _transformer_analyzer(SentimentAnalyzer, second_model)
+    for analyzer in (first, second):
+        analyzer.inference_cache, analyzer.model_key = cache, "fake-sst2:torch"
+
+    baseline = first.analyze_articles(SAMPLE_ARTICLES[:2], fields=["title"])
+    rerun = second.analyze_articles(SAMPLE_ARTICLES + [{"title": "Fresh progress in talks"}], fields=["title"])
+    cache.close()
+
+    assert second_model.calls == [["Fresh progress in talks"]]
+    assert rerun[:2] == baseline
+    assert rerun[3]["sentiment_analysis"]["title"]["label"] == "POSITIVE"
+
+
+def test_inference_cache_write_failure_keeps_model_scores(tmp_path, monkeypatch):
+    cache = InferenceCache(str(tmp_path / "analysis.db"))
+    analyzer = _transformer_analyzer(SentimentAnalyzer, FakeSentimentPipeline())
+    analyzer.inference_cache, analyzer.model_key = cache, "fake-sst2:torch"
+
+    def locked_store(_results, _model_name):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache, "store", locked_store)
+    analyzed = analyzer.analyze_articles(SAMPLE_ARTICLES[:1], fields=["title"])
+    cache.close()
+
+    assert analyzed[0]["sentiment_analysis"]["title"]["score"] == 0.9
+
+
+def test_shared_token_pass_skips_texts_every_analyzer_has_cached(tmp_path):
+    cache = InferenceCache(str(tmp_path / "analysis.db"))
+    sentiment = _transformer_analyzer(SentimentAnalyzer, FakeSentimentPipeline())
+    emotion = _transformer_analyzer(EmotionAnalyzer, FakeEmotionPipeline())
+    sentiment.inference_cache, sentiment.model_key = cache, "fake-sst2:torch"
+    emotion.inference_cache, emotion.model_key = cache, "fake-emotion:torch"
+    texts = [article["title"] for article in SAMPLE_ARTICLES[:2]]
+    expected = {id(analyzer): analyzer._analyze_texts(texts) for analyzer in (sentiment, emotion)}
+
+    def forward(_batch):
+        raise AssertionError("cached texts must not reach the encoder")
+
+    scores = _analyze_shared_tokens(texts, [sentiment, emotion], batch_size=8, logits_fn=forward)
+    cache.close()
+
+    assert scores == expected
+
+
+def test_emotion_small_model_labels_map_onto_canonical_emotions():
+    analyzer = EmotionAnalyzer(prefer_transformers=False)
+
+    scores = analyzer._normalize_scores(
+        [{"label": "love", "score": 0.2}, {"label": "joy", "score": 0.5}, {"label": "fear", "score": 0.3}]
+    )
+
+    assert list(scores) == EmotionAnalyzer.EMOTIONS
+    assert scores["joy"] == 0.7
+    assert scores["disgust"] == 0.0
+
+
+
+def test_emotion_analyzer_defaults_to_base_model_and_opts_into_small(monkeypatch):
+    loaded = []
+
+    def fake_load_text_classifier(_task, model_name, **_kwargs):
+        loaded.append(model_name)
+        return FakeEmotionPipeline(), "torch"
+
+    monkeypatch.setenv("GNS_INFERENCE_CACHE", "0")
+    monkeypatch.setattr("src.analysis.emotion.transformers_available", lambda: True)
+    monkeypatch.setattr("src.analysis.emotion.load_text_classifier", fake_load_text_classifier)
+
+    EmotionAnalyzer(prefer_transformers=True)
+    EmotionAnalyzer(prefer_transformers=True, model_size="small")
+
+    assert loaded == [EmotionAnalyzer.MODEL_SIZES["base"], EmotionAnalyzer.MODEL_SIZES["small"]]
+
+def test_analyze_text_reuses_cached_result_for_repeated_text():
+    fake_model = FakeEmotionPipeline()
+    analyzer = _transformer_analyzer(EmotionAnalyzer, fake_model)
+    description = "Wire reprint: crisis talks stall. " * 20
+
+    first = analyzer.analyze_text(description)
+    second = analyzer.analyze_text(description + "Updated with new quotes.")
+    first["fear"] = 0.0
+
+    assert len(fake_model.calls) == 1
+    assert second["fear"] == 0.7
+    assert analyzer.cache_info().hits == 1
+
+
+def test_analyze_articles_scores_duplicate_texts_once():
+    fake_model = FakeSentimentPipeline()
+    analyzer = _transformer_analyzer(SentimentAnalyzer, fake_model)
+    articles = [{"title": "Peace talks resume", "description": "Peace talks resume"}] * 3
+
+    analyzed = analyzer.analyze_articles(articles, fields=["title", "description"])
+
+    assert fake_model.calls == [["Peace talks resume"]]
+    assert all(item["sentiment_analysis"]["title"]["label"] == "NEGATIVE" for item in analyzed)
+    assert analyzed[0]["sentiment_analysis"]["title"] is not analyzed[1]["sentiment_analysis"]["title"]
+
+
+def test_analyze_articles_inplace_writes_into_input_dicts():
+    analyzer = EmotionAnalyzer(prefer_transformers=False)
+    articles = [dict(item) for item in SAMPLE_ARTICLES]
+
+    analyzed = analyzer.analyze_articles(articles, fields=["title", "description"], inplace=True)
+
+    assert analyzed[0] is articles[0]
+    overall = articles[1]["emotion_analysis"]["overall"]
+    assert overall["dominant_score"] == max(overall[emotion] for emotion in EmotionAnalyzer.EMOTIONS)
+
+
+def test_emotion_statistics_average_only_articles_with_overall_scores():
+    analyzer = EmotionAnalyzer(prefer_transformers=False)
+    analyzed = [
+        {"emotion_analysis": {"overall": {"fear": 0.6, "joy": 0.2, "dominant_emotion": "fear", "dominant_score": 0.6}}},
+        {"emotion_analysis": {"overall": {"fear": 0.2, "joy": 0.4, "dominant_emotion": "joy", "dominant_score": 0.4}}},
+        {"emotion_analysis": {"overall": {"fear": 0.7, "dominant_emotion": "fear", "dominant_score": 0.7}}},
+        {"emotion_analysis": {}},
+    ]
+
+    stats = analyzer.get_emotion_statistics(analyzed)
+
+    assert stats["total_analyzed"] == 4
+    assert stats["average_emotions"]["fear"] == 0.5
+    assert stats["average_emotions"]["joy"] == 0.3
+    assert stats["average_emotions"]["anger"] == 0.0
+    assert stats["dominant_emotion_counts"] == {"fear": 2, "joy": 1}
+    assert stats["most_common_emotion"] == "fear"
+    assert stats["emotion_distribution"] == {"fear": 66.67, "joy": 33.33}
+
+
+def test_sentiment_statistics_count_labels_and_average_signals():
+    analyzer = SentimentAnalyzer(prefer_transformers=False)
+    analyzed = [
+        {"sentiment_analysis": {"overall": {"label": "NEGATIVE", "score": 0.9, "negative_percent": 80.0}}},
+        {"sentiment_analysis": {"overall": {"label": "NEGATIVE", "score": 0.7, "negative_percent": 60.0}}},
+        {"sentiment_analysis": {"overall": {"label": "POSITIVE", "score": 0.8, "positive_percent": 70.0}}},
+        {"sentiment_analysis": {}},
+    ]
+
+    stats = analyzer.get_sentiment_statistics(analyzed)
+
+    assert stats["total_analyzed"] == 3
+    assert (stats["positive"], stats["negative"], stats["neutral"]) == (1, 2, 0)
+    assert stats["negative_percent"] == 66.67
+    assert stats["positive_percent"] == 33.33
+    assert stats["average_confidence"] == 0.8
+    assert stats["average_negative_signal"] == 46.67
+    assert stats["average_neutral_signal"] == 0.0
+
+
+def test_saved_articles_round_scores_only_at_write_time(tmp_path):
+    analyzer = EmotionAnalyzer(prefer_transformers=False)
+    analyzed = analyzer.analyze_articles([{"title": "Fear and anger over the threat"}], fields=["title"])
+    output = tmp_path / "analyzed.json"
+
+    save_analyzed_articles(analyzed, str(output))
+    saved = load_articles_from_json(str(output))[0]["emotion_analysis"]["title"]
+
+    assert analyzed[0]["emotion_analysis"]["title"]["anger"] == 1 / 3
+    assert saved["anger"] == 0.3333
+
+
+def test_saved_articles_round_trip_with_unicode(tmp_path):
+    articles = [{"title": "Kyiv – Київ talks", "sentiment_analysis": {"overall": {"label": "NEUTRAL", "score": 0.5}}}]
+    output = tmp_path / "analyzed.json"
+
+    save_analyzed_articles(articles, str(output))
+
+    assert "Київ" in output.read_text(encoding="utf-8")
+    assert load_articles_from_json(str(output)) == articles
+
+
+def test_streamed_json_load_matches_full_load(tmp_path):
+    wrapped = tmp_path / "wrapped.json"
+    bare = tmp_path / "bare.json"
+    wrapped.write_text('{"total_articles": 3, "articles": ' + json.dumps(SAMPLE_ARTICLES) + "}", encoding="utf-8")
+    bare.write_text(" \n" + json.dumps(SAMPLE_ARTICLES), encoding="utf-8")
+
+    for path in (wrapped, bare):
+        streamed = load_articles_from_json(str(path), stream=True)
+        assert not isinstance(streamed, list)
+        assert list(streamed) == load_articles_from_json(str(path)) == SAMPLE_ARTICLES
+
+
+def test_ndjson_round_trip_streams_analyzed_articles(tmp_path):
+    analyzer = SentimentAnalyzer(prefer_transformers=False)
+    output = tmp_path / "analyzed.ndjson"
+
+    analyzed = analyzer.iter_analyze_articles((dict(item) for item in SAMPLE_ARTICLES), chunk_size=2)
+    written = save_analyzed_articles_ndjson(analyzed, str(output))
+    loaded = load_articles_from_json(str(output))
+
+    assert written == 3
+    assert not isinstance(loaded, list)
+    assert [item["title"] for item in loaded] == [item["title"] for item in SAMPLE_ARTICLES]
+
+
+def test_previous_results_are_only_reused_for_the_same_analyzer_models(tmp_path):
+    heuristic = SentimentAnalyzer(prefer_transformers=False), EmotionAnalyzer(prefer_transformers=False)
+    transformer = (
+        SimpleNamespace(backend="transformers", model_key="sentiment-model:torch"),
+        SimpleNamespace(backend="transformers", model_key="emotion-model:torch"),
+    )
+    article = dict(SAMPLE_ARTICLES[0], sentiment={"label": "neutral"})
+    output = tmp_path / "sentiment_emotion_analysis.json"
+    output.write_text(
+        json.dumps({"analyzers": analysis_script.analyzer_signature(*heuristic), "articles": [article]}),
+        encoding="utf-8",
+    )
+
+    done = analysis_script.load_previous_results(output)
+
+    assert done[analysis_script.article_key(article, analysis_script.analyzer_signature(*heuristic))] == article
+    assert analysis_script.article_key(article, analysis_script.analyzer_signature(*transformer)) not in done
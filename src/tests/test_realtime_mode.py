@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 import requests
@@ -15,6 +18,8 @@ import run_realtime
 from src.ingestion.gdelt_ingestor import GDELTNewsIngestor
 from src.ingestion.rss_ingestor import RSSNewsIngestor
 from src.pipeline.stage2_reaction_analysis import run_stage as run_stage2
+import src.utils.background_writer as background_writer
+from src.utils.background_writer import get_background_writer, write_bytes_atomic
 import src.realtime.live_news_monitor as live_monitor
 
 
@@ -381,16 +386,24 @@ def test_news_ingestor_retries_on_connection_error(monkeypatch):
             raise requests.exceptions.ConnectionError("network down")
         return FakeResponse()
 
-    monkeypatch.setattr(news_ingestor.requests, "get", fake_get)
     monkeypatch.setattr(news_ingestor.time, "sleep", lambda _seconds: None)
 
-    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key", session=SimpleNamespace(get=fake_get))
     articles = ingestor.fetch_news(query="geopolitics", days_back=1, max_articles=1)
 
     assert attempts["count"] == 3
     assert len(articles) == 1
 
 
+def test_news_ingestor_reuses_pooled_session_and_closes_it():
+    with news_ingestor.NewsIngestor(api_key="test-key") as ingestor:
+        adapter = ingestor.session.get_adapter("https://newsapi.org/v2/everything")
+
+    assert isinstance(ingestor.session, requests.Session)
+    assert adapter._pool_maxsize == news_ingestor.NewsIngestor.POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
+
+
 def test_news_ingestor_builds_global_domain_batches():
     ingestor = news_ingestor.NewsIngestor(api_key="test-key")
     batches = ingestor._build_domain_batches(None)
@@ -422,9 +435,10 @@ def test_news_ingestor_surfaces_api_message_on_429(monkeypatch):
         def json(self):
             return {"status": "error", "message": "You have made too many requests recently. Developer accounts are limited."}
 
-    monkeypatch.setattr(news_ingestor.requests, "get", lambda *_args, **_kwargs: FakeResponse())
-
-    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+    ingestor = news_ingestor.NewsIngestor(
+        api_key="test-key",
+        session=SimpleNamespace(get=lambda *_args, **_kwargs: FakeResponse()),
+    )
     payload = ingestor._request_json_with_retries(
         url="https://newsapi.org/v2/top-headlines",
         params={"country": "us", "apiKey": "test-key"},
@@ -470,6 +484,300 @@ def test_news_ingestor_normalizes_broad_top_headline_query_to_empty():
     assert ingestor._normalize_top_headlines_query("iran OR israel") == "iran OR israel"
 
 
+def test_news_ingestor_fetches_multiple_topics_concurrently(monkeypatch):
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+
+    def fake_fetch_news(query, days_back, max_articles):
+        if query == "taiwan":
+            ingestor.last_failure_reason = "everything HTTP 429"
+            return []
+        return [{"title": f"{query} update", "max": max_articles}]
+
+    monkeypatch.setattr(ingestor, "fetch_news", fake_fetch_news)
+
+    results = ingestor.fetch_multiple_topics(["iran", "ukraine", "taiwan"], days_back=1, max_per_topic=5)
+
+    assert list(results) == ["iran", "ukraine", "taiwan"]
+    assert results["ukraine"] == [{"title": "ukraine update", "max": 5}]
+    assert ingestor.topic_failure_reasons == {"iran": "", "ukraine": "", "taiwan": "everything HTTP 429"}
+
+
+def test_news_ingestor_fetch_multiple_topics_works_inside_running_loop(monkeypatch):
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+    monkeypatch.setattr(ingestor, "fetch_news", lambda query, days_back, max_articles: [{"title": query}])
+
+    async def called_from_notebook_cell():
+        return ingestor.fetch_multiple_topics(["iran", "ukraine"], max_per_topic=5)
+
+    results = asyncio.run(called_from_notebook_cell())
+
+    assert results == {"iran": [{"title": "iran"}], "ukraine": [{"title": "ukraine"}]}
+
+
+def test_news_ingestor_rate_limiter_spaces_request_slots(monkeypatch):
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+    monkeypatch.setattr(news_ingestor.time, "monotonic", lambda: 100.0)
+
+    with ingestor._rate_limit_scope():
+        delays = [ingestor._reserve_request_slot() for _ in range(3)]
+
+    interval = 1.0 / ingestor.REQUESTS_PER_SECOND
+    assert delays == pytest.approx([0.0, interval, 2 * interval])
+    assert ingestor._reserve_request_slot() == 0.0
+
+
+def test_news_ingestor_fetch_news_alone_is_not_rate_limited(monkeypatch):
+    sleeps = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def __init__(self, page):
+            self.page = page
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            articles = [
+                {"title": f"Sanctions update {self.page}-{index}", "url": f"https://example.test/{self.page}/{index}"}
+                for index in range(10)
+            ]
+            return {"status": "ok", "totalResults": 30, "articles": articles}
+
+    monkeypatch.setattr(news_ingestor.time, "sleep", sleeps.append)
+    session = SimpleNamespace(get=lambda _url, params, timeout: FakeResponse(params["page"]))
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key", session=session)
+
+    articles = ingestor.fetch_news(query="sanctions", sources="bbc-news", max_articles=30)
+
+    assert len(articles) == 30
+    assert sleeps == []
+
+
+def test_news_ingestor_statistics_count_sources_and_date_range():
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+    articles = [
+        {"source": {"name": "Reuters"}, "publishedAt": "2026-03-02T10:00:00Z"},
+        {"source": "AP", "published_at": "2026-03-01T08:00:00Z"},
+        {"source": {"name": "Reuters"}},
+        {"source": {}, "publishedAt": "2026-03-03T12:00:00Z"},
+    ]
+
+    stats = ingestor.get_statistics(articles)
+
+    assert stats["sources"] == 3
+    assert stats["top_sources"] == {"Reuters": 2, "AP": 1, "Unknown": 1}
+    assert stats["date_range"] == {"earliest": "2026-03-01T08:00:00Z", "latest": "2026-03-03T12:00:00Z"}
+
+
+def test_news_ingestor_afetch_news_falls_back_to_threaded_fetch(monkeypatch):
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+    monkeypatch.setattr(news_ingestor, "aiohttp", None)
+    monkeypatch.setattr(ingestor, "fetch_news", lambda **kwargs: [{"title": kwargs["query"]}])
+
+    articles = asyncio.run(ingestor.afetch_news(query="ukraine", max_articles=5))
+
+    assert articles == [{"title": "ukraine"}]
+
+
+def test_news_ingestor_afetch_news_requests_remaining_pages_concurrently(monkeypatch):
+    class FakeConnectionError(Exception):
+        pass
+
+    requested_pages = []
+    failures = {"left": 1}
+
+    class FakeResponse:
+        status = 200
+
+        def __init__(self, page):
+            self.page = page
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_exc_info):
+            return None
+
+        async def read(self):
+            articles = [
+                {"title": f"Sanctions update {self.page}-{index}", "url": f"https://example.test/{self.page}/{index}"}
+                for index in range(100)
+            ]
+            return json.dumps({"status": "ok", "totalResults": 250, "articles": articles}).encode("utf-8")
+
+    def fake_get(_url, params, timeout):
+        if params["page"] == 2 and failures["left"]:
+            failures["left"] -= 1
+            raise FakeConnectionError("network down")
+        requested_pages.append(params["page"])
+        return FakeResponse(params["page"])
+
+    async def no_sleep(_seconds):
+        return None
+
+    fake_aiohttp = SimpleNamespace(
+        ClientTimeout=lambda total: total,
+        ClientConnectionError=FakeConnectionError,
+        ClientError=FakeConnectionError,
+    )
+    monkeypatch.setattr(news_ingestor, "aiohttp", fake_aiohttp)
+    monkeypatch.setattr(news_ingestor.asyncio, "sleep", no_sleep)
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+
+    articles = asyncio.run(
+        ingestor.afetch_news(query="sanctions", sources="bbc-news", max_articles=250, session=SimpleNamespace(get=fake_get))
+    )
+
+    assert sorted(requested_pages) == [1, 2, 3]
+    assert len(articles) == 250
+
+
+def test_news_ingestor_afetch_news_stops_global_fan_out_early(monkeypatch):
+    requests_made = []
+
+    class FakeResponse:
+        status = 200
+
+        def __init__(self, url, params):
+            self.url = url
+            self.params = params
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_exc_info):
+            return None
+
+        async def read(self):
+            if "top-headlines" in self.url:
+                return json.dumps({"status": "ok", "totalResults": 0, "articles": []}).encode("utf-8")
+            domains = self.params["domains"]
+            articles = [
+                {"title": f"Sanctions talks {domains} {index}", "url": f"https://{domains}/{index}"}
+                for index in range(self.params["pageSize"])
+            ]
+            return json.dumps({"status": "ok", "totalResults": len(articles), "articles": articles}).encode("utf-8")
+
+    def fake_get(url, params, timeout):
+        requests_made.append(params.get("country") or params["domains"])
+        return FakeResponse(url, params)
+
+    async def no_sleep(_seconds):
+        return None
+
+    monkeypatch.setattr(news_ingestor, "aiohttp", SimpleNamespace(ClientTimeout=lambda total: total))
+    monkeypatch.setattr(news_ingestor.asyncio, "sleep", no_sleep)
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+    monkeypatch.setattr(ingestor, "TOP_HEADLINE_COUNTRIES", ["us", "gb"])
+
+    articles = asyncio.run(ingestor.afetch_news(query="sanctions", max_articles=5, session=SimpleNamespace(get=fake_get)))
+
+    domain_batches = ingestor._build_domain_batches(None)
+    assert requests_made == ["us", "gb"] + domain_batches[:ingestor.DOMAIN_BATCH_CONCURRENCY]
+    assert len(articles) == 5
+
+
+
+def test_news_ingestor_afetch_news_reuses_pooled_session_until_closed(monkeypatch):
+    class FakeSession:
+        def __init__(self):
+            self.closed = False
+            self.requests = 0
+
+        def get(self, _url, params, timeout):
+            self.requests += 1
+            return FakeResponse()
+
+        async def close(self):
+            self.closed = True
+
+    class FakeResponse:
+        status = 200
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_exc_info):
+            return None
+
+        async def read(self):
+            articles = [{"title": "Sanctions talks resume", "url": "https://example.test/sanctions"}]
+            return json.dumps({"status": "ok", "totalResults": 1, "articles": articles}).encode("utf-8")
+
+    built = []
+
+    def build_session():
+        built.append(FakeSession())
+        return built[-1]
+
+    monkeypatch.setattr(news_ingestor, "aiohttp", SimpleNamespace(ClientTimeout=lambda total: total))
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key")
+    monkeypatch.setattr(ingestor, "_build_async_session", build_session)
+
+    async def fetch_twice_then_close():
+        for _ in range(2):
+            await ingestor.afetch_news(query="sanctions", sources="bbc-news", max_articles=1)
+        await ingestor.aclose()
+
+    asyncio.run(fetch_twice_then_close())
+
+    assert len(built) == 1
+    assert built[0].requests == 2
+    assert built[0].closed
+
+def test_news_ingestor_saves_articles_in_background(tmp_path):
+    ingestor = news_ingestor.NewsIngestor(api_key="test-key", data_dir=str(tmp_path))
+    articles = [{"title": "Kyiv – Київ talks", "url": "https://example.test/kyiv", "source": {"name": "BBC"}}]
+
+    path = ingestor.save_articles(articles, "background.json", background=True)
+    get_background_writer().flush()
+
+    saved = json.loads(Path(path).read_text(encoding="utf-8"))
+    assert saved["total_articles"] == 1
+    assert saved["articles"][0]["title"] == "Kyiv – Київ talks"
+    assert saved["articles"][0]["source"] == "BBC"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["background.json"]
+
+
+def test_write_bytes_atomic_keeps_concurrent_writes_of_one_path_whole(tmp_path):
+    path = tmp_path / "shared.json"
+    payloads = [bytes([ord("a") + index]) * 200_000 for index in range(8)]
+    errors = []
+
+    def write(payload):
+        try:
+            write_bytes_atomic(path, payload)
+        except OSError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(payload,)) for payload in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert path.read_bytes() in payloads
+    assert [entry.name for entry in tmp_path.iterdir()] == ["shared.json"]
+
+
+
+def test_write_bytes_atomic_respects_umask_and_existing_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(background_writer, "_UMASK", 0o077)
+    new_file = tmp_path / "new.json"
+    existing = tmp_path / "existing.json"
+    existing.write_bytes(b"old")
+    existing.chmod(0o640)
+
+    write_bytes_atomic(new_file, b"{}")
+    write_bytes_atomic(existing, b"{}")
+
+    assert new_file.stat().st_mode & 0o777 == 0o600
+    assert existing.stat().st_mode & 0o777 == 0o640
+    assert existing.read_bytes() == b"{}"
+
 def test_run_realtime_parser_accepts_bare_interval_flag():
     parser = run_realtime.build_parser()
     args = parser.parse_args(["--query", "geopolitics", "--interval"])
@@ -0,0 +1,97 @@
+"""
+Background file writer for bulk saves.
+Callers hand over already-serialized bytes and return immediately; a daemon
+thread performs the writes, and anything still queued is flushed at exit.
+"""
+
+import atexit
+import logging
+import os
+from pathlib import Path
+import queue
+import stat
+import tempfile
+import threading
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_shared_writer: Optional["BackgroundWriter"] = None
+_shared_writer_lock = threading.Lock()
+
+
+def _read_umask() -> int:
+    # os.umask can only be read by setting it; do so once, before any writer thread starts.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+class BackgroundWriter:
+    """Write queued (path, bytes) jobs on a single daemon thread."""
+
+    def __init__(self):
+        self._queue: "queue.Queue[Tuple[Path, bytes]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="background-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, path: str | Path, data: bytes) -> None:
+        """Queue `data` to replace the contents of `path`."""
+        self._queue.put((Path(path), data))
+
+    def flush(self) -> None:
+        """Block until every queued write has finished."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            path, data = self._queue.get()
+            try:
+                write_bytes_atomic(path, data)
+            except OSError as exc:
+                logger.error("Background write failed | path=%s | error=%s", path, exc)
+            finally:
+                self._queue.task_done()
+
+
+def write_bytes_atomic(path: str | Path, data: bytes) -> None:
+    """
+    Write `data` to a uniquely named temporary sibling and rename it over `path`.
+
+    Concurrent writers of the same path each get their own temporary file, so
+    one can never rename away or truncate another's half-written data.
+    """
+    path = Path(path)
+    handle = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    temp_path = Path(handle.name)
+    try:
+        with handle:
+            handle.write(data)
+        os.chmod(temp_path, _target_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _target_mode(path: Path) -> int:
+    """Keep the mode of an existing target; new files get the usual 0o666 minus the umask."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def get_background_writer() -> BackgroundWriter:
+    """Return the process-wide writer so all background saves share one thread."""
+    global _shared_writer
+    with _shared_writer_lock:
+        if _shared_writer is None:
+            _shared_writer = BackgroundWriter()
+        return _shared_writer
@@ -0,0 +1,95 @@
+"""
+Persistent SQLite cache for transformer analyzer predictions.
+"""
+
+import atexit
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+DEFAULT_CACHE_PATH = "data/cache/analysis.db"
+SQLITE_MAX_VARIABLES = 900
+
+_shared_caches: Dict[str, "InferenceCache"] = {}
+_shared_caches_lock = threading.Lock()
+
+
+class InferenceCache:
+    """Store per-text analyzer results keyed by sha256 of the text and model."""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._init_schema()
+        atexit.register(self.close)
+
+    def _init_schema(self) -> None:
+        with self._lock:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS predictions (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL
+                )
+                """
+            )
+            self._connection.commit()
+
+    @staticmethod
+    def make_key(text: str, model_name: str) -> str:
+        return hashlib.sha256((text + "\x1f" + model_name).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        with self._lock:
+            row = self._connection.execute("SELECT result FROM predictions WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        self.put_many({key: value})
+
+    def put_many(self, items: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO predictions (key, result) VALUES (?, ?)",
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in items.items()],
+            )
+            self._connection.commit()
+
+    def lookup(self, texts: List[str], model_name: str) -> Dict[int, Dict[str, Any]]:
+        """Return cached results for `texts`, keyed by position in the list."""
+        keys = [self.make_key(text, model_name) for text in texts]
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                chunk = keys[start:start + SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self._connection.execute(
+                    f"SELECT key, result FROM predictions WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update((key, json.loads(result)) for key, result in rows)
+        return {position: found[key] for position, key in enumerate(keys) if key in found}
+
+    def store(self, results: Dict[str, Dict[str, Any]], model_name: str) -> None:
+        """Cache freshly computed results, given as {text: result}."""
+        self.put_many({self.make_key(text, model_name): result for text, result in results.items()})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.commit()
+                self._connection.close()
+                self._connection = None
+
+
+def get_inference_cache(db_path: str = DEFAULT_CACHE_PATH) -> InferenceCache:
+    """Return the process-wide cache for db_path so analyzers share one connection."""
+    with _shared_caches_lock:
+        if db_path not in _shared_caches:
+            _shared_caches[db_path] = InferenceCache(db_path)
+        return _shared_caches[db_path]
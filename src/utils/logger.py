@@ -3,8 +3,12 @@ Logging utility for the Geopolitical Narrative System.
 Provides consistent logging across all modules.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -12,6 +16,24 @@ from typing import Optional
 from .console import configure_console_output
 
 
+class _FastFormatter(logging.Formatter):
+    """Formatter that re-renders %(asctime)s only when the second changes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_time = (-1, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        last_second, last_text = self._last_time
+        if second != last_second:
+            last_text = time.strftime(datefmt, self.converter(second))
+            self._last_time = (second, last_text)
+        return last_text
+
+
 def setup_logger(
     name: str = "geopolitical_narrative",
     log_dir: str = "logs",
@@ -20,6 +42,9 @@ def setup_logger(
 ) -> logging.Logger:
     """
     Set up a logger with file and console handlers.
+
+    The logger itself only enqueues records; a background QueueListener
+    (kept on ``logger.queue_listener``) does the file and console writes.
     
     Args:
         name: Logger name
@@ -45,12 +70,12 @@ def setup_logger(
         return logger
     
     # Create formatters
-    detailed_formatter = logging.Formatter(
+    detailed_formatter = _FastFormatter(
         fmt='%(asctime)s | %(name)s | %(levelname)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    simple_formatter = logging.Formatter(
+    simple_formatter = _FastFormatter(
         fmt='%(levelname)s: %(message)s'
     )
     
@@ -62,14 +87,22 @@ def setup_logger(
     )
     file_handler.setLevel(logging.DEBUG)  # Log everything to file
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
+    handlers = [file_handler]
     
     # Console handler - simpler format
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(simple_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Hand records to a background thread so log calls never block on I/O
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    logger.queue_listener = listener
+    atexit.register(listener.stop)
     
     return logger
 
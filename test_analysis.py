@@ -3,16 +3,27 @@ Test script for Stage 3 - Sentiment and Emotion Analysis
 Runs both analyzers on your fetched news articles.
 """
 
+import argparse
+import hashlib
+import heapq
 import sys
 from pathlib import Path
 import json
+import operator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from utils.console import configure_console_output
 from analysis.sentiment import SentimentAnalyzer, load_articles_from_json
+from analysis.combined_analyzer import CombinedBatch, combined_analyze
 from analysis.emotion import EmotionAnalyzer
+from analysis.rounding import round_floats
 
 configure_console_output()
 
@@ -24,8 +35,57 @@ def print_header(text: str):
     print("="*60)
 
 
-def main():
-    """Run complete sentiment and emotion analysis."""
+def analyzer_signature(sentiment_analyzer, emotion_analyzer) -> str:
+    """Describe the backend and model behind each analyzer's scores."""
+    return (
+        f"sentiment={sentiment_analyzer.backend}:{sentiment_analyzer.model_key}"
+        f"|emotion={emotion_analyzer.backend}:{emotion_analyzer.model_key}"
+    )
+
+
+def article_key(article: dict, signature: str = "") -> str:
+    """Hash an article's URL, title and analyzer signature ("" if it has neither URL nor title)."""
+    url = article.get("url") or ""
+    title = article.get("title") or ""
+    if not url and not title:
+        return ""
+    return hashlib.sha1(f"{url}\x1f{title}\x1f{signature}".encode("utf-8")).hexdigest()
+
+
+def load_previous_results(output_file: Path) -> dict:
+    """
+    Map article_key -> analyzed article from a previous run's output file.
+
+    Keys include the analyzer signature the file was written with, so results
+    from another backend or model never match the current run.
+    """
+    if not output_file.exists():
+        return {}
+    try:
+        if orjson is not None:
+            data = orjson.loads(output_file.read_bytes())
+        else:
+            data = json.loads(output_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        print(f"⚠️  Ignoring unreadable previous results: {exc}")
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    signature = data.get("analyzers", "")
+    return {
+        key: article
+        for article in data.get("articles", [])
+        if (key := article_key(article, signature))
+    }
+
+
+def main(force: bool = False):
+    """
+    Run complete sentiment and emotion analysis.
+    
+    Articles already present in the previous output file are reused
+    instead of re-analyzed unless force is True.
+    """
     
     print_header("STAGE 3: SENTIMENT & EMOTION ANALYSIS TEST")
     
@@ -38,26 +98,56 @@ def main():
         print("  python test_news_ingestion.py")
         return
     
-    print(f"\n📂 Loading articles from: {input_file}")
-    articles = load_articles_from_json(input_file)
-    print(f"✓ Loaded {len(articles)} articles")
+    output_dir = Path("data/processed/combined_analysis")
+    output_file = output_dir / "sentiment_emotion_analysis.json"
+    
+    print("\n🔄 Initializing sentiment and emotion analyzers...")
+    sentiment_analyzer = SentimentAnalyzer.preload()
+    emotion_analyzer = EmotionAnalyzer.preload()
+    signature = analyzer_signature(sentiment_analyzer, emotion_analyzer)
+    
+    # Reuse analyses from the previous run, keyed by URL + title + analyzer backends/models
+    done = {} if force else load_previous_results(output_file)
+    merged = []
+    
+    def pending_articles(articles):
+        """Yield articles that still need analysis, recording a slot for every article."""
+        for article in articles:
+            previous = done.get(article_key(article, signature))
+            merged.append(previous)
+            if previous is None:
+                yield article
+    
+    # Articles are parsed one at a time and previously analyzed ones are skipped;
+    # combined_analyze then collects the remaining articles into one batch
+    print(f"\n📂 Streaming articles from: {input_file}")
+    articles = pending_articles(load_articles_from_json(input_file, stream=True))
+    
+    # One pass over the articles: texts are prepared and tokenized once for both models
+    print("\n🔍 Analyzing sentiment and emotions in articles...")
+    combined_results = combined_analyze(
+        articles,
+        fields=["title", "description"],
+        sentiment_analyzer=sentiment_analyzer,
+        emotion_analyzer=emotion_analyzer,
+        batch_size=32,
+        inplace=True,  # the parsed articles become the combined buffer; no per-article copies
+    )
+    reused = sum(previous is not None for previous in merged)
+    fresh = iter(combined_results)
+    combined_results = [previous if previous is not None else next(fresh) for previous in merged]
+    
+    # Column view of the reported fields; the article dicts are not copied
+    batch = CombinedBatch.from_articles(combined_results)
+    print(f"✓ Analyzed {len(batch) - reused} articles, reused {reused} from the previous run")
     
     # ========================================
     # PART 1: SENTIMENT ANALYSIS
     # ========================================
     print_header("PART 1: SENTIMENT ANALYSIS")
     
-    print("\n🔄 Initializing sentiment analyzer...")
-    sentiment_analyzer = SentimentAnalyzer()
-    
-    print("\n🔍 Analyzing sentiment in articles...")
-    sentiment_results = sentiment_analyzer.analyze_articles(
-        articles,
-        fields=["title", "description"]
-    )
-    
     # Get sentiment statistics
-    sentiment_stats = sentiment_analyzer.get_sentiment_statistics(sentiment_results)
+    sentiment_stats = sentiment_analyzer.get_sentiment_statistics(batch.articles)
     
     print("\n📊 SENTIMENT RESULTS:")
     print(f"  Total analyzed:     {sentiment_stats['total_analyzed']}")
@@ -71,28 +161,19 @@ def main():
     # ========================================
     print_header("PART 2: EMOTION ANALYSIS")
     
-    print("\n🔄 Initializing emotion analyzer...")
-    emotion_analyzer = EmotionAnalyzer()
-    
-    print("\n🔍 Analyzing emotions in articles...")
-    emotion_results = emotion_analyzer.analyze_articles(
-        articles,
-        fields=["title", "description"]
-    )
-    
     # Get emotion statistics
-    emotion_stats = emotion_analyzer.get_emotion_statistics(emotion_results)
+    emotion_stats = emotion_analyzer.get_emotion_statistics(batch.articles)
     
     print("\n📊 EMOTION RESULTS:")
     print(f"  Total analyzed:     {emotion_stats['total_analyzed']}")
     print(f"  Most common:        {emotion_stats['most_common_emotion'].upper()}")
     
+    # Ranked once, reused for the summary report below
+    distribution = emotion_stats['emotion_distribution']
+    sorted_dist = heapq.nlargest(len(distribution), distribution.items(), key=operator.itemgetter(1))
+    
     print("\n  Emotion Distribution:")
-    for emotion, percentage in sorted(
-        emotion_stats['emotion_distribution'].items(),
-        key=lambda x: x[1],
-        reverse=True
-    ):
+    for emotion, percentage in sorted_dist:
         bar_length = int(percentage / 2)
         bar = "█" * bar_length
         print(f"    {emotion:10s} {percentage:5.1f}% {bar}")
@@ -102,35 +183,22 @@ def main():
     # ========================================
     print_header("SAMPLE ARTICLE ANALYSIS")
     
-    # Merge both analyses
-    combined_results = []
-    for sent_article, emo_article in zip(sentiment_results, emotion_results):
-        combined = sent_article.copy()
-        combined["emotion_analysis"] = emo_article.get("emotion_analysis", {})
-        combined_results.append(combined)
-    
     # Show top 3 articles
-    for i, article in enumerate(combined_results[:3], 1):
-        print(f"\n[{i}] {article.get('title', 'No title')[:70]}...")
-        print(f"    Source: {article.get('source', 'Unknown')}")
-        print(f"    Published: {article.get('published_at', 'Unknown')}")
+    for i in range(min(3, len(batch))):
+        print(f"\n[{i + 1}] {batch.titles[i][:70]}...")
+        print(f"    Source: {batch.sources[i]}")
+        print(f"    Published: {batch.published_at[i]}")
         
         # Sentiment
-        sentiment = article.get('sentiment_analysis', {}).get('overall', {})
-        if sentiment:
-            print(f"    📊 Sentiment: {sentiment['label']} (confidence: {sentiment['score']})")
+        if batch.sentiment_labels[i]:
+            print(f"    📊 Sentiment: {batch.sentiment_labels[i]} (confidence: {batch.sentiment_scores[i]:.4f})")
         
         # Emotion
-        emotion = article.get('emotion_analysis', {}).get('overall', {})
-        if emotion and 'dominant_emotion' in emotion:
-            dom_emotion = emotion['dominant_emotion']
-            dom_score = emotion['dominant_score']
-            print(f"    😊 Dominant Emotion: {dom_emotion.upper()} (confidence: {dom_score})")
+        if batch.emotion_labels[i]:
+            print(f"    😊 Dominant Emotion: {batch.emotion_labels[i].upper()} (confidence: {batch.emotion_scores[i]:.4f})")
             
             # Top 3 emotions
-            emotion_scores = {k: v for k, v in emotion.items() 
-                            if k not in ['dominant_emotion', 'dominant_score']}
-            top_3 = sorted(emotion_scores.items(), key=lambda x: x[1], reverse=True)[:3]
+            top_3 = batch.top_emotions(i)
             print(f"    🎭 Top emotions: {', '.join(f'{e}({s:.2f})' for e, s in top_3)}")
     
     # ========================================
@@ -139,42 +207,42 @@ def main():
     print_header("SAVING RESULTS")
     
     # Save combined analysis
-    output_dir = Path("data/processed/combined_analysis")
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    output_file = output_dir / "sentiment_emotion_analysis.json"
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            "total_articles": len(combined_results),
-            "sentiment_statistics": sentiment_stats,
-            "emotion_statistics": emotion_stats,
-            "articles": combined_results
-        }, f, indent=2, ensure_ascii=False)
+    payload = {
+        "total_articles": len(batch),
+        "analyzers": signature,
+        "sentiment_statistics": sentiment_stats,
+        "emotion_statistics": emotion_stats,
+        "articles": round_floats(batch.articles)
+    }
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        output_file.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding='utf-8')
     
     print(f"\n✓ Combined analysis saved to: {output_file}")
     
     # Also save summary report
     summary_file = output_dir / "analysis_summary.txt"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write("GEOPOLITICAL NARRATIVE ANALYSIS - SUMMARY REPORT\n")
-        f.write("=" * 60 + "\n\n")
+    summary_lines = [
+        "GEOPOLITICAL NARRATIVE ANALYSIS - SUMMARY REPORT\n",
+        "=" * 60 + "\n\n",
         
-        f.write("SENTIMENT ANALYSIS:\n")
-        f.write(f"  Total articles:  {sentiment_stats['total_analyzed']}\n")
-        f.write(f"  Positive:        {sentiment_stats['positive']} ({sentiment_stats['positive_percent']}%)\n")
-        f.write(f"  Negative:        {sentiment_stats['negative']} ({sentiment_stats['negative_percent']}%)\n")
-        f.write(f"  Neutral:         {sentiment_stats['neutral']} ({sentiment_stats['neutral_percent']}%)\n\n")
+        "SENTIMENT ANALYSIS:\n",
+        f"  Total articles:  {sentiment_stats['total_analyzed']}\n",
+        f"  Positive:        {sentiment_stats['positive']} ({sentiment_stats['positive_percent']}%)\n",
+        f"  Negative:        {sentiment_stats['negative']} ({sentiment_stats['negative_percent']}%)\n",
+        f"  Neutral:         {sentiment_stats['neutral']} ({sentiment_stats['neutral_percent']}%)\n\n",
         
-        f.write("EMOTION ANALYSIS:\n")
-        f.write(f"  Most common emotion: {emotion_stats['most_common_emotion']}\n")
-        f.write(f"  Distribution:\n")
-        for emotion, percentage in sorted(
-            emotion_stats['emotion_distribution'].items(),
-            key=lambda x: x[1],
-            reverse=True
-        ):
-            f.write(f"    {emotion:10s}: {percentage:5.1f}%\n")
+        "EMOTION ANALYSIS:\n",
+        f"  Most common emotion: {emotion_stats['most_common_emotion']}\n",
+        "  Distribution:\n",
+    ]
+    for emotion, percentage in sorted_dist:
+        summary_lines.append(f"    {emotion:10s}: {percentage:5.1f}%\n")
+    # One write instead of a syscall per line
+    summary_file.write_text("".join(summary_lines), encoding='utf-8')
     
     print(f"✓ Summary report saved to: {summary_file}")
     
@@ -220,8 +288,15 @@ def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Stage 3 sentiment and emotion analysis.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-analyze every article instead of reusing results from the previous run",
+    )
+    args = parser.parse_args()
     try:
-        main()
+        main(force=args.force)
     except KeyboardInterrupt:
         print("\n\n⚠️  Analysis interrupted by user")
     except Exception as e:
@@ -3,6 +3,7 @@ Test script for news ingestion.
 Fetches a small batch of articles to verify everything works.
 """
 
+import asyncio
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -18,6 +19,18 @@ from utils.logger import setup_logger
 configure_console_output()
 
 
+async def fetch_test_articles(ingestor: NewsIngestor) -> list:
+    """Fetch the sample articles, closing the pooled aiohttp session on the same loop."""
+    try:
+        return await ingestor.afetch_news(
+            query="Ukraine Russia conflict",
+            days_back=3,
+            max_articles=10
+        )
+    finally:
+        await ingestor.aclose()
+
+
 def main():
     """Test the news ingestion system."""
     
@@ -60,11 +73,8 @@ def main():
     logger.info("")
     
     try:
-        articles = ingestor.fetch_news(
-            query="Ukraine Russia conflict",
-            days_back=3,
-            max_articles=10
-        )
+        # Independent NewsAPI requests are issued concurrently
+        articles = asyncio.run(fetch_test_articles(ingestor))
     except Exception as e:
         logger.error(f"❌ Failed to fetch articles: {e}")
         logger.error("")